@@ -26,7 +26,7 @@ def main(model, config):
         model = ModelYAMLInterpreter().parse(model)
         # Parse the configuration file if provided; otherwise, prompt user for configuration
         if config is not None:
-            config = ConfigurationYAMLInterpreter().parse(config)
+            config = ConfigurationYAMLInterpreter(model).parse(config)
         else:
             config = ProjectConfiguration()
             config.init_form()  # Prompts user for configuration settings
@@ -1,12 +1,14 @@
 from abc import ABC, abstractmethod
 from jinja2 import Environment, FileSystemLoader
 import os
+import shutil
 
 from pygen.generators.backend_test_generator import FlaskTestGenerator, SecurityTestGenerator, \
-    IntegrationTestGenerator
+    IntegrationTestGenerator, FastApiTestGenerator, FastApiSecurityTestGenerator, FastApiIntegrationTestGenerator, \
+    LoadTestGenerator, BenchmarkTestGenerator, FastApiBenchmarkTestGenerator, PytestConfigGenerator
 from pygen.generators.dockerfile_generator import BackendDockerfileGenerator
 from pygen.generators.pipeline_generator import AzureDevOpsPipelineGenerator, GithubActionsPipelineGenerator
-from pygen.models.flask_psm import PsmModel, Entity
+from pygen.models.flask_psm import PsmModel, Entity, AssociationTable
 
 
 class IBackendApiGenerator(ABC):
@@ -52,11 +54,14 @@ class IBackendApiGenerator(ABC):
         self._generate_controllers(root_path + '/app/controllers')
         self._generate_services(root_path + '/app/services')
         self._generate_models(root_path + '/app/models')
+        self._generate_migrations(root_path + '/migrations')
         self._generate_schemas(root_path + '/app/schemas')
+        self._generate_serializers(root_path + '/app/serializers')
         self._generate_tests(root_path + '/tests')
         config = {
-            "base_image": "python:3.9-slim",
-            "port": port
+            "base_image": "python:3.12-slim",
+            "port": port,
+            "command": self._get_server_command(port),
         }
         generator = BackendDockerfileGenerator(root_path, config)
         generator.generate()
@@ -77,6 +82,16 @@ class IBackendApiGenerator(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def _get_server_command(self, port):
+        """
+        Abstract method to build the command that serves the application in the Docker image.
+
+        Args:
+            port (int): The port number for the service.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _generate_app(self, path, port):
         """
@@ -128,6 +143,30 @@ class IBackendApiGenerator(ABC):
         """
         raise NotImplementedError
 
+    def _generate_migrations(self, path):
+        """
+        Generates the database migrations for the backend API.
+
+        Optional step: generators that create the schema in another way
+        do not need to override it.
+
+        Args:
+            path (str): Path to the migrations directory.
+        """
+        pass
+
+    def _generate_serializers(self, path):
+        """
+        Generates response serializer files for the backend API.
+
+        Optional step: generators that serialize responses through their schemas
+        do not need to override it.
+
+        Args:
+            path (str): Path to the serializers directory.
+        """
+        pass
+
     @abstractmethod
     def _transform_model(self, model):
         """
@@ -184,8 +223,9 @@ class FlaskApiGenerator(IBackendApiGenerator):
 
     def _generate_project_files(self, root_path):
         """
-        Generates the base project structure, a `run.py` file, a `requirements.txt` file,
-        and a `config.py` file.
+        Generates the base project structure, a `run.py` file, the `requirements.txt` and
+        `requirements-dev.txt` files, a `config.py` file, and a `gunicorn.conf.py` file when
+        metrics are enabled.
 
         Args:
             root_path (str): The root directory where the project will be generated.
@@ -208,18 +248,7 @@ class FlaskApiGenerator(IBackendApiGenerator):
         print(f"`run.py` generated at {run_py_path}")
 
         # Generate `requirements.txt`
-        requirements = [
-            "Flask",
-            "Flask-Migrate",
-            "Flask-SQLAlchemy",
-            "marshmallow",
-            "flask-cors",
-            "pytest",
-            "requests",
-            "pynt",
-            "Flask-JWT-Extended",
-            "cryptography",
-        ]
+        requirements = self._get_requirements()
 
         requirements_path = os.path.join(root_path, "requirements.txt")
         with open(requirements_path, "w") as req_file:
@@ -227,6 +256,15 @@ class FlaskApiGenerator(IBackendApiGenerator):
 
         print(f"`requirements.txt` generated at {requirements_path}")
 
+        # Generate `requirements-dev.txt`, the tests and tools on top of the runtime dependencies
+        dev_requirements = ["-r requirements.txt"] + self._get_dev_requirements()
+
+        dev_requirements_path = os.path.join(root_path, "requirements-dev.txt")
+        with open(dev_requirements_path, "w") as req_file:
+            req_file.write("\n".join(dev_requirements))
+
+        print(f"`requirements-dev.txt` generated at {dev_requirements_path}")
+
         # Generate `config.py`
         config_template = env.get_template('config_template.jinja2')
         context = {
@@ -240,9 +278,87 @@ class FlaskApiGenerator(IBackendApiGenerator):
 
         print(f"`config.py` generated at {config_path}")
 
+        # Generate `gunicorn.conf.py`, whose hooks keep the metrics of the workers consistent
+        if self._config.backend.metrics:
+            gunicorn_template = env.get_template('gunicorn_conf_template.jinja2')
+            gunicorn_path = os.path.join(root_path, "gunicorn.conf.py")
+
+            with open(gunicorn_path, "w") as gunicorn_file:
+                gunicorn_file.write(gunicorn_template.render())
+
+            print(f"`gunicorn.conf.py` generated at {gunicorn_path}")
+
         print(f"Project structure created at {root_path}")
 
 
+    def _get_requirements(self):
+        """
+        Builds the list of dependencies written to the generated `requirements.txt`, the ones the
+        application needs at runtime.
+
+        Returns:
+            list: The package names required by the generated project.
+        """
+        requirements = [
+            "Flask",
+            "Flask-Migrate",
+            "Flask-SQLAlchemy",
+            "marshmallow",
+            "flask-cors",
+            "gunicorn",
+            "Flask-JWT-Extended",
+            "cryptography",
+        ]
+        if self._config.backend.database.uses_engine("postgresql"):
+            requirements.append("psycopg2-binary")
+        if self._config.backend.serialization == "orjson":
+            requirements.append("orjson")
+        if self._config.backend.validation == "pydantic":
+            requirements.append("pydantic")
+        if self._config.backend.compression and self._config.backend.compression["brotli"]:
+            requirements.append("Brotli")
+        if self._config.backend.rate_limit and self._config.backend.rate_limit["store"] == "redis":
+            requirements.append("redis")
+        if self._config.backend.metrics:
+            requirements.append("prometheus-client")
+        return requirements
+
+    def _get_dev_requirements(self):
+        """
+        Builds the list of dependencies written to the generated `requirements-dev.txt`, the ones
+        only the tests and the load tests need.
+
+        Returns:
+            list: The package names required to test the generated project.
+        """
+        return [
+            "pytest",
+            "pytest-benchmark",
+            "pytest-xdist",
+            "requests",
+            "pynt",
+            "locust",
+        ]
+
+    def _get_server_command(self, port):
+        """
+        Builds the command that serves the application in the Docker image.
+
+        The number of worker processes is read by the server from `WEB_CONCURRENCY`.
+
+        Args:
+            port (int): The port number for the service.
+
+        Returns:
+            list: The command and its arguments.
+        """
+        # Threaded workers, like the development server, so a slow request does not hold up the rest
+        command = ["gunicorn", "--bind", f"0.0.0.0:{port}", "--threads", "4", "run:app"]
+        if self._config.backend.metrics:
+            # The server hooks clean up the metrics of the workers that exit
+            command[1:1] = ["-c", "gunicorn.conf.py"]
+        return command
+
     def _generate_app(self, path, port):
         """
         Generates the `__init__.py` file for the Flask application.
@@ -272,6 +388,20 @@ class FlaskApiGenerator(IBackendApiGenerator):
 
         print(f"`__init__.py` has been generated at {init_file}")
 
+        # Optional Prometheus metrics module
+        if self._config.backend.metrics:
+            metrics_file = os.path.join(path, "metrics.py")
+            with open(metrics_file, "w") as output_file:
+                output_file.write(env.get_template('metrics_template.jinja2').render(context))
+            print(f"`metrics.py` has been generated at {metrics_file}")
+
+        # Optional rate limiting and load shedding module
+        if self._config.backend.rate_limit:
+            limiter_file = os.path.join(path, "limiter.py")
+            with open(limiter_file, "w") as output_file:
+                output_file.write(env.get_template('limiter_template.jinja2').render(context))
+            print(f"`limiter.py` has been generated at {limiter_file}")
+
     def _generate_controllers(self, path):
         """
         Generates Flask controllers for each entity using their respective services.
@@ -319,9 +449,21 @@ class FlaskApiGenerator(IBackendApiGenerator):
         for entity in self._psm_model.entities:
             # Render the service template
             template = env.get_template('service_template.jinja2')
+            eager_loads = self._psm_model.nested_relationship_paths(entity)
+            relationship_eager_loads = {
+                relationship.name: self._psm_model.related_relationship_paths(entity, relationship)
+                for relationship in entity.relationships
+            }
+            imported = {entity.name} | {relationship.target for relationship in entity.relationships}
             context = {
                 "entity": entity,
-                "config": self._config.backend
+                "config": self._config.backend,
+                "eager_loads": eager_loads,
+                "relationship_eager_loads": relationship_eager_loads,
+                "eager_load_entities": sorted({
+                    name for paths in [eager_loads, *relationship_eager_loads.values()]
+                    for path in paths for name, _ in path
+                } - imported)
             }
             rendered_code = template.render(context)
 
@@ -347,7 +489,11 @@ class FlaskApiGenerator(IBackendApiGenerator):
 
         # Generate `__init__.py` for models
         init_template = env.get_template('models_init_template.jinja2')
-        init_context = {"entities": self._psm_model.entities, "config": self._config}
+        init_context = {
+            "entities": self._psm_model.entities,
+            "association_tables": self._psm_model.association_tables,
+            "config": self._config,
+        }
         init_rendered = init_template.render(init_context)
         init_file_path = os.path.join(path, "__init__.py")
         with open(init_file_path, "w") as init_file:
@@ -366,6 +512,42 @@ class FlaskApiGenerator(IBackendApiGenerator):
                 model_file.write(model_rendered)
             print(f"Model generated for {entity.name} at {model_file_path}")
 
+    def _generate_migrations(self, path):
+        """
+        Generates the Flask-Migrate (Alembic) environment and an initial migration built from the PSM model.
+
+        The schema is created with `flask db upgrade` instead of `db.create_all()` on every application start.
+
+        Args:
+            path (str): The path to the `migrations` directory.
+        """
+        migrations_templates_path = os.path.join(self._templates_path, "migrations")
+        os.makedirs(os.path.join(path, "versions"), exist_ok=True)
+
+        # The Alembic environment is the standard single-database one of Flask-Migrate
+        for file_name in ["alembic.ini", "env.py", "script.py.mako", "README"]:
+            shutil.copy(os.path.join(migrations_templates_path, file_name), os.path.join(path, file_name))
+
+        entities, deferred_foreign_keys = self._psm_model.sort_entities_by_dependencies()
+        foreign_keys = {
+            (entity.table_name, field.name): field.foreign_key
+            for entity in entities for field in entity.fields if field.foreign_key
+        }
+        env = Environment(loader=FileSystemLoader(migrations_templates_path))
+        template = env.get_template("initial_migration_template.jinja2")
+        rendered_code = template.render(
+            entities=entities,
+            association_tables=self._psm_model.association_tables,
+            deferred_foreign_keys=deferred_foreign_keys,
+            foreign_keys=foreign_keys,
+            revision="0001_initial",
+            config=self._config,
+        )
+        migration_file_path = os.path.join(path, "versions", "0001_initial.py")
+        with open(migration_file_path, "w") as migration_file:
+            migration_file.write(rendered_code)
+        print(f"Initial migration generated at {migration_file_path}")
+
     def _generate_schemas(self, path):
         """
         Generates Marshmallow schemas for each entity and its related entities.
@@ -383,17 +565,53 @@ class FlaskApiGenerator(IBackendApiGenerator):
         # Generate schemas for each entity
         for entity in self._psm_model.entities:
             # Generate the main schema for the entity
-            self._generate_single_schema(env, path, entity)
+            self._generate_single_schema(env, path, entity, self._config)
 
             # If microservices, also generate schemas for related entities
             if self._config.backend.architecture == "microservices":
                 for relationship in entity.relationships:
                     related_entity = next((e for e in self._psm_model.entities if e.name == relationship.target), None)
                     if related_entity:
-                        self._generate_single_schema(env, path, related_entity)
+                        self._generate_single_schema(env, path, related_entity, self._config)
+
+        # Generate the compiled validation helpers shared by the schemas
+        if self._config.backend.validation == "pydantic":
+            validation_template = env.get_template('schema_validation_template.jinja2')
+            validation_file_path = os.path.join(path, "validation.py")
+            with open(validation_file_path, "w") as validation_file:
+                validation_file.write(validation_template.render())
+            print(f"Validation helpers generated at {validation_file_path}")
+
+    def _generate_serializers(self, path):
+        """
+        Generates plain serializer functions for each entity when the `orjson`
+        serialization is enabled. They read the columns listed in the PSM directly,
+        avoiding the cost of `Schema.dump` on every response.
+
+        Args:
+            path (str): The path to the serializers directory.
+        """
+        if self._config.backend.serialization != "orjson":
+            return
+
+        # Setup Jinja2 environment
+        env = Environment(loader=FileSystemLoader(self._templates_path))
+
+        # Path to the serializers directory
+        os.makedirs(path, exist_ok=True)
+
+        template = env.get_template('serializer_template.jinja2')
+        for entity in self._psm_model.entities:
+            rendered_code = template.render(entity=entity)
+
+            serializer_file_path = os.path.join(path, f"{entity.name.lower()}_serializer.py")
+            with open(serializer_file_path, "w") as serializer_file:
+                serializer_file.write(rendered_code)
+
+            print(f"Serializer generated for {entity.name} at {serializer_file_path}")
 
     @staticmethod
-    def _generate_single_schema(env, schemas_path, entity):
+    def _generate_single_schema(env, schemas_path, entity, config):
         """
         Generates a single schema for an entity.
 
@@ -401,10 +619,11 @@ class FlaskApiGenerator(IBackendApiGenerator):
             env (Environment): The Jinja2 environment.
             schemas_path (str): Path to the schemas' directory.
             entity (Entity): The entity for which the schema is generated.
+            config (ProjectConfiguration): The project configuration.
         """
         # Render the schema template
         template = env.get_template('schema_template.jinja2')
-        context = {"entity": entity}
+        context = {"entity": entity, "config": config}
         rendered_code = template.render(context)
 
         # Write the schema to a file
@@ -465,12 +684,18 @@ class FlaskApiGenerator(IBackendApiGenerator):
                 # Use reverse relationship name for back_populates
                 back_populates = reverse_relationship_data["name"] if reverse_relationship_data else None
 
+                # Many-to-many relationships join through an association table shared by both sides
+                secondary_table = None
+                if pim_relationship.type == "many-to-many":
+                    secondary_table = self._add_association_table(psm_model, pim_entity.name, pim_relationship.target)
+
                 # Add the relationship to the PSM entity
                 psm_entity.add_relationship(
                     name=relationship_data["name"],
                     target=pim_relationship.target,
                     rel_type=pim_relationship.type,
-                    back_populates=back_populates
+                    back_populates=back_populates,
+                    secondary_table=secondary_table
                 )
 
             # Add the PSM entity to the PSM model
@@ -478,6 +703,33 @@ class FlaskApiGenerator(IBackendApiGenerator):
 
         self._psm_model = psm_model  # Assign the transformed model to the class attribute
 
+    @staticmethod
+    def _add_association_table(psm_model, entity_name, target_name):
+        """
+        Adds the association table of a many-to-many relationship to the PSM model, once for both sides.
+
+        The table and column order is alphabetical, so both sides of the relationship get the same table.
+
+        Args:
+            psm_model (PsmModel): The PSM model being built.
+            entity_name (str): Name of one entity of the relationship.
+            target_name (str): Name of the other entity of the relationship.
+
+        Returns:
+            str: The name of the association table.
+        """
+        left, right = sorted([entity_name.lower(), target_name.lower()])
+        table_name = f"{left}s_{right}s"
+        if table_name not in [table.name for table in psm_model.association_tables]:
+            psm_model.add_association_table(AssociationTable(
+                table_name,
+                left_column=f"{left}_id",
+                left_foreign_key=f"{left}s.id",
+                right_column=f"{right}_id",
+                right_foreign_key=f"{right}s.id",
+            ))
+        return table_name
+
     @staticmethod
     def _map_type_to_sqlalchemy(pim_type):
         """
@@ -509,6 +761,12 @@ class FlaskApiGenerator(IBackendApiGenerator):
         integration_test_generator.generate()
         security_test_generator = SecurityTestGenerator(self._config, self._psm_model, path + '/security')
         security_test_generator.generate()
+        load_test_generator = LoadTestGenerator(self._config, self._psm_model, path + '/load')
+        load_test_generator.generate()
+        benchmark_generator = BenchmarkTestGenerator(self._config, self._psm_model, path + '/benchmarks')
+        benchmark_generator.generate()
+        pytest_config_generator = PytestConfigGenerator(self._config, path)
+        pytest_config_generator.generate()
 
     def _generate_authentication_files(self, root_path):
         """
@@ -549,3 +807,158 @@ class FlaskApiGenerator(IBackendApiGenerator):
             file.write(auth_service_template.render())
 
         print("Authentication files generated successfully.")
+
+
+class FastApiGenerator(FlaskApiGenerator):
+    """
+    Implementation of IBackendApiGenerator for asynchronous FastAPI-based APIs.
+
+    The generation pipeline and the PIM to PSM transformation are shared with the
+    Flask generator; only the templates, the SQLAlchemy type mapping, the dependencies
+    and the generated tests differ. Endpoints are `async` and use SQLAlchemy's
+    `AsyncSession`, so a worker is not blocked while it waits on the database.
+
+    Attributes:
+        _templates_path (str): Path to the directory containing Jinja2 templates.
+    """
+
+    def __init__(self, config):
+        """
+        Initializes the FastAPI generator with a given configuration.
+
+        Args:
+            config (object): The configuration object for the FastAPI generation process.
+        """
+        super().__init__(config)
+        template_dir = os.path.join(os.path.dirname(__file__), "templates")
+        self._templates_path = template_dir + "/backend/fastapi"
+
+    def _get_requirements(self):
+        """
+        Builds the list of dependencies written to the generated `requirements.txt`, the ones the
+        application needs at runtime.
+
+        Returns:
+            list: The package names required by the generated project.
+        """
+        requirements = [
+            "fastapi",
+            "uvicorn",
+            "SQLAlchemy[asyncio]",
+            "aiosqlite",
+            "pydantic",
+            "PyJWT",
+            "cryptography",
+        ]
+        if self._config.backend.database.uses_engine("postgresql"):
+            requirements.append("asyncpg")
+        return requirements
+
+    def _get_dev_requirements(self):
+        """
+        Builds the list of dependencies written to the generated `requirements-dev.txt`, adding the
+        client of FastAPI's `TestClient` to the ones of the Flask tests.
+
+        Returns:
+            list: The package names required to test the generated project.
+        """
+        return ["httpx"] + super()._get_dev_requirements()
+
+    def _get_server_command(self, port):
+        """
+        Builds the command that serves the application in the Docker image.
+
+        The number of worker processes is read by the server from `WEB_CONCURRENCY`.
+
+        Args:
+            port (int): The port number for the service.
+
+        Returns:
+            list: The command and its arguments.
+        """
+        return ["uvicorn", "run:app", "--host", "0.0.0.0", "--port", str(port)]
+
+    def _generate_project_files(self, root_path):
+        """
+        Generates the base project files of the Flask generator and an `init_db.py` file, which
+        creates the schema once for deployments whose processes must not all create it on startup.
+
+        Args:
+            root_path (str): The root directory where the project will be generated.
+        """
+        super()._generate_project_files(root_path)
+
+        env = Environment(loader=FileSystemLoader(self._templates_path))
+        template = env.get_template('init_db_template.jinja2')
+        init_db_path = os.path.join(root_path, "init_db.py")
+
+        with open(init_db_path, "w") as init_db_file:
+            init_db_file.write(template.render())
+
+        print(f"`init_db.py` generated at {init_db_path}")
+
+    def _generate_migrations(self, path):
+        """
+        FastAPI projects create their schema in the application lifespan, or with `init_db.py`,
+        so no migrations are generated.
+
+        Args:
+            path (str): The path to the `migrations` directory.
+        """
+        pass
+
+    def _generate_schemas(self, path):
+        """
+        Generates Pydantic schemas for each entity and the `__init__.py` file of the
+        `schemas` package, which holds the helper that formats validation errors.
+
+        Args:
+            path (str): The path to the schemas directory.
+        """
+        super()._generate_schemas(path)
+
+        env = Environment(loader=FileSystemLoader(self._templates_path))
+        init_template = env.get_template('schemas_init_template.jinja2')
+        init_file_path = os.path.join(path, "__init__.py")
+        with open(init_file_path, "w") as init_file:
+            init_file.write(init_template.render())
+        print(f"`__init__.py` generated at {init_file_path}")
+
+    @staticmethod
+    def _map_type_to_sqlalchemy(pim_type):
+        """
+        Maps PIM attribute types to SQLAlchemy core column types.
+
+        Args:
+            pim_type (str): The type of the attribute in the PIM model.
+
+        Returns:
+            str: The corresponding SQLAlchemy column type.
+        """
+        type_mapping = {
+            "String": "String(255)",  # Default length for strings
+            "Integer": "Integer",  # Integer types
+            "Date": "Date",  # Date types
+            "Boolean": "Boolean",  # Boolean types
+            "Float": "Float",  # Floating-point types
+            "Text": "Text",  # Larger text fields
+            "DateTime": "DateTime",  # Date and time types
+        }
+
+        # Return the mapped type or a default (e.g., String(255) for unknown types)
+        return type_mapping.get(pim_type, "String(255)")
+
+    def _generate_tests(self, path):
+        unit_test_generator = FastApiTestGenerator(self._config, self._psm_model, path + '/unit')
+        unit_test_generator.generate()
+        integration_test_generator = FastApiIntegrationTestGenerator(self._config, self._psm_model,
+                                                                     path + '/integration')
+        integration_test_generator.generate()
+        security_test_generator = FastApiSecurityTestGenerator(self._config, self._psm_model, path + '/security')
+        security_test_generator.generate()
+        load_test_generator = LoadTestGenerator(self._config, self._psm_model, path + '/load')
+        load_test_generator.generate()
+        benchmark_generator = FastApiBenchmarkTestGenerator(self._config, self._psm_model, path + '/benchmarks')
+        benchmark_generator.generate()
+        pytest_config_generator = PytestConfigGenerator(self._config, path)
+        pytest_config_generator.generate()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from pygen.generators.api import FlaskApiGenerator
+from pygen.generators.api import FlaskApiGenerator, FastApiGenerator
 from pygen.models.backend_pim import PimModel, Entity
 
 
@@ -11,6 +11,8 @@ class IBackendGenerator(ABC):
         self._cim_model = model
         if self._config.backend.framework == 'flask':
             self._api_generator = FlaskApiGenerator(self._config)
+        elif self._config.backend.framework == 'fastapi':
+            self._api_generator = FastApiGenerator(self._config)
 
     def generate(self):
         self._transform_model()
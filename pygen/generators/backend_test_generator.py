@@ -25,11 +25,20 @@ class FlaskTestGenerator:
         """
         os.makedirs(self._tests_path, exist_ok=True)
 
-        for entity in self._psm_model.entities:
-            self._generate_controller_tests(entity)
-            self._generate_service_tests(entity)
-            self._generate_schema_tests(entity)
-            self._generate_model_tests(entity)
+        if self._config.test_layout == "consolidated":
+            self._generate_consolidated_tests()
+        else:
+            for entity in self._psm_model.entities:
+                self._generate_controller_tests(entity)
+                self._generate_service_tests(entity)
+                self._generate_schema_tests(entity)
+                self._generate_model_tests(entity)
+                if self._config.backend.serialization == "orjson":
+                    self._generate_serializer_tests(entity)
+
+        if (self._config.backend.compression or self._config.backend.database.production_replicas
+                or self._config.backend.rate_limit or self._config.backend.metrics):
+            self._generate_app_tests()
 
     def _generate_controller_tests(self, entity):
         """
@@ -39,7 +48,9 @@ class FlaskTestGenerator:
             entity (Entity): The entity to generate tests for.
         """
         template = self._env.get_template("controller_test_template.jinja2")
-        rendered = template.render(entity=entity, config=self._config)
+        rendered = template.render(
+            entity=entity, config=self._config, psm_model=self._psm_model, query_budgets=self._query_budgets(entity)
+        )
         file_path = os.path.join(self._tests_path, f"test_{entity.name.lower()}_controller.py")
         with open(file_path, "w") as file:
             file.write(rendered)
@@ -53,12 +64,66 @@ class FlaskTestGenerator:
             entity (Entity): The entity to generate tests for.
         """
         template = self._env.get_template("service_test_template.jinja2")
-        rendered = template.render(entity=entity)
+        rendered = template.render(
+            entity=entity, config=self._config, psm_model=self._psm_model, query_budgets=self._query_budgets(entity)
+        )
         file_path = os.path.join(self._tests_path, f"test_{entity.name.lower()}_service.py")
         with open(file_path, "w") as file:
             file.write(rendered)
         print(f"Service test generated for {entity.name} at {file_path}")
 
+    def _generate_consolidated_tests(self):
+        """
+        Generates a single test module per layer, parametrized over a table with a row per entity.
+
+        Large models otherwise produce thousands of modules, whose collection dominates the test run.
+        """
+        layers = ["controller", "service", "schema", "model"]
+        if self._config.backend.serialization == "orjson":
+            layers.append("serializer")
+
+        for layer in layers:
+            template = self._env.get_template(f"consolidated/{layer}_test_template.jinja2")
+            rendered = template.render(
+                entities=self._psm_model.entities,
+                config=self._config,
+                psm_model=self._psm_model,
+                query_budgets={entity.name: self._query_budgets(entity) for entity in self._psm_model.entities},
+            )
+            file_path = os.path.join(self._tests_path, f"test_{layer}s.py")
+            with open(file_path, "w") as file:
+                file.write(rendered)
+            print(f"Consolidated {layer} tests generated at {file_path}")
+
+    def _query_budgets(self, entity):
+        """
+        Computes the maximum number of SQL statements of the list and relationship reads of an entity.
+
+        A read runs one statement, plus one per level of nested relationships eager loaded with
+        `selectinload`. With orjson nothing nested is dumped, so only the statement itself and the
+        lazy load of the requested relationship run.
+
+        Args:
+            entity (Entity): The entity whose service is tested.
+
+        Returns:
+            dict: The budget of `get_all` under 'list', and of each relationship read under its name.
+        """
+        def budget(paths):
+            levels = {tuple(path[:depth]) for path in paths for depth in range(1, len(path) + 1)}
+            return 1 + len(levels)
+
+        if self._config.backend.serialization == "orjson":
+            budgets = {relationship.name: 2 for relationship in entity.relationships}
+            budgets["list"] = 1
+            return budgets
+        budgets = {
+            relationship.name: budget(self._psm_model.related_relationship_paths(entity, relationship))
+            for relationship in entity.relationships
+        }
+        budgets["list"] = budget(self._psm_model.nested_relationship_paths(entity))
+        return budgets
+
     def _generate_schema_tests(self, entity):
         """
         Generates unit tests for the model of an entity.
@@ -67,7 +132,7 @@ class FlaskTestGenerator:
             entity (Entity): The entity to generate tests for.
         """
         template = self._env.get_template("schema_test_template.jinja2")
-        rendered = template.render(entity=entity)
+        rendered = template.render(entity=entity, config=self._config)
         file_path = os.path.join(self._tests_path, f"test_{entity.name.lower()}_schema.py")
         with open(file_path, "w") as file:
             file.write(rendered)
@@ -87,6 +152,32 @@ class FlaskTestGenerator:
             file.write(rendered)
         print(f"Model test generated for {entity.name} at {file_path}")
 
+    def _generate_serializer_tests(self, entity):
+        """
+        Generates unit tests for the serializer of an entity.
+
+        Args:
+            entity (Entity): The entity to generate tests for.
+        """
+        template = self._env.get_template("serializer_test_template.jinja2")
+        rendered = template.render(entity=entity)
+        file_path = os.path.join(self._tests_path, f"test_{entity.name.lower()}_serializer.py")
+        with open(file_path, "w") as file:
+            file.write(rendered)
+        print(f"Serializer test generated for {entity.name} at {file_path}")
+
+    def _generate_app_tests(self):
+        """
+        Generates unit tests for the application-wide behaviour, such as response compression,
+        read replica routing, rate limiting or metrics.
+        """
+        template = self._env.get_template("app_test_template.jinja2")
+        rendered = template.render(config=self._config, entities=self._psm_model.entities)
+        file_path = os.path.join(self._tests_path, "test_app.py")
+        with open(file_path, "w") as file:
+            file.write(rendered)
+        print(f"App test generated at {file_path}")
+
 
 class SecurityTestGenerator:
     def __init__(self, config, psm_model, tests_path):
@@ -111,11 +202,24 @@ class SecurityTestGenerator:
         """
         os.makedirs(self._tests_path, exist_ok=True)
 
+        self._generate_conftest()
         for entity in self._psm_model.entities:
             self._generate_security_tests(entity)
 
         self._generate_pyntfile()
 
+    def _generate_conftest(self):
+        """
+        Generates the fixtures shared by the security tests: the application under test and its client,
+        created once per test session.
+        """
+        template = self._env.get_template("conftest_template.jinja2")
+        rendered = template.render(config=self._config)
+        file_path = os.path.join(self._tests_path, "conftest.py")
+        with open(file_path, "w") as file:
+            file.write(rendered)
+        print(f"Security test fixtures generated at {file_path}")
+
     def _generate_security_tests(self, entity):
         """
         Generates pytest-based security tests for a specific entity's controller.
@@ -165,9 +269,22 @@ class IntegrationTestGenerator:
         """
         os.makedirs(self._tests_path, exist_ok=True)
 
+        self._generate_conftest()
         for entity in self._psm_model.entities:
             self._generate_integration_tests(entity)
 
+    def _generate_conftest(self):
+        """
+        Generates the fixtures shared by the integration tests: one application and schema per
+        session, and a transaction rolled back after every test.
+        """
+        template = self._env.get_template("conftest_template.jinja2")
+        rendered = template.render(config=self._config)
+        file_path = os.path.join(self._tests_path, "conftest.py")
+        with open(file_path, "w") as file:
+            file.write(rendered)
+        print(f"Integration test fixtures generated at {file_path}")
+
     def _generate_integration_tests(self, entity):
         """
         Generates integration tests for a specific entity.
@@ -181,3 +298,206 @@ class IntegrationTestGenerator:
         with open(file_path, "w") as file:
             file.write(rendered)
         print(f"Integration tests generated for {entity.name} at {file_path}")
+
+
+class BenchmarkTestGenerator:
+    def __init__(self, config, psm_model, tests_path):
+        """
+        Initializes the BenchmarkTestGenerator.
+
+        Args:
+            config (ProjectConfiguration): Configuration of the project.
+            psm_model (PsmModel): Platform-Specific Model for the backend.
+            tests_path (str): Path where the benchmark files will be generated.
+        """
+        self._config = config
+        self._psm_model = psm_model
+        self._tests_path = tests_path
+        template_dir = os.path.join(os.path.dirname(__file__), "templates")
+        self._templates_path = template_dir + "/backend/flask/benchmarks"
+        self._env = Environment(loader=FileSystemLoader(self._templates_path))
+
+    def generate(self):
+        """
+        Generates pytest-benchmark files that time the service methods of every entity.
+        """
+        os.makedirs(self._tests_path, exist_ok=True)
+
+        for entity in self._psm_model.entities:
+            self._generate_service_benchmarks(entity)
+
+    def _generate_service_benchmarks(self, entity):
+        """
+        Generates the benchmarks of the service of an entity, run against several data sizes.
+
+        Args:
+            entity (Entity): The entity to generate benchmarks for.
+        """
+        template = self._env.get_template("service_benchmark_template.jinja2")
+        rendered = template.render(entity=entity, config=self._config, psm_model=self._psm_model)
+        file_path = os.path.join(self._tests_path, f"test_{entity.name.lower()}_benchmark.py")
+        with open(file_path, "w") as file:
+            file.write(rendered)
+        print(f"Service benchmarks generated for {entity.name} at {file_path}")
+
+
+class LoadTestGenerator:
+    def __init__(self, config, psm_model, tests_path):
+        """
+        Initializes the LoadTestGenerator.
+
+        The Locust scenarios only use the HTTP API, so they are shared by every backend framework.
+
+        Args:
+            config (ProjectConfiguration): Configuration of the project.
+            psm_model (PsmModel): Platform-Specific Model for the backend.
+            tests_path (str): Path where the load test files will be generated.
+        """
+        self._config = config
+        self._psm_model = psm_model
+        self._tests_path = tests_path
+        template_dir = os.path.join(os.path.dirname(__file__), "templates")
+        self._templates_path = template_dir + "/backend/load_tests"
+        self._env = Environment(loader=FileSystemLoader(self._templates_path))
+
+    def generate(self):
+        """
+        Generates the Locust file with a user class per entity and its headless configuration.
+        """
+        os.makedirs(self._tests_path, exist_ok=True)
+
+        # Records are seeded parents first, so every foreign key of a payload points to an existing row
+        entities, deferred_foreign_keys = self._psm_model.sort_entities_by_dependencies()
+        tables = {entity.table_name: entity.name.lower() for entity in entities}
+        foreign_key_targets = {
+            (entity.name, field.name): tables[field.foreign_key.split('.')[0]]
+            for entity in entities for field in entity.fields if field.foreign_key
+        }
+        template = self._env.get_template("locustfile_template.jinja2")
+        rendered = template.render(
+            entities=entities,
+            deferred_foreign_keys={
+                (entity.name, field_name) for entity in entities for table_name, field_name in deferred_foreign_keys
+                if entity.table_name == table_name
+            },
+            foreign_key_targets=foreign_key_targets,
+            config=self._config,
+        )
+        file_path = os.path.join(self._tests_path, "locustfile.py")
+        with open(file_path, "w") as file:
+            file.write(rendered)
+        print(f"Load tests generated at {file_path}")
+
+        template = self._env.get_template("locust_conf_template.jinja2")
+        file_path = os.path.join(self._tests_path, "locust.conf")
+        with open(file_path, "w") as file:
+            file.write(template.render(config=self._config))
+        print(f"Load test configuration generated at {file_path}")
+
+
+class PytestConfigGenerator:
+    def __init__(self, config, tests_path):
+        """
+        Initializes the PytestConfigGenerator.
+
+        The pytest configuration only isolates processes, so it is shared by every backend framework.
+
+        Args:
+            config (ProjectConfiguration): Configuration of the project.
+            tests_path (str): Path of the tests directory; pytest.ini is generated next to it.
+        """
+        self._config = config
+        self._tests_path = tests_path
+        template_dir = os.path.join(os.path.dirname(__file__), "templates")
+        self._templates_path = template_dir + "/backend/pytest"
+        self._env = Environment(loader=FileSystemLoader(self._templates_path))
+
+    def generate(self):
+        """
+        Generates the root conftest.py that isolates each pytest-xdist worker and the pytest.ini of the backend.
+        """
+        os.makedirs(self._tests_path, exist_ok=True)
+
+        template = self._env.get_template("conftest_template.jinja2")
+        file_path = os.path.join(self._tests_path, "conftest.py")
+        with open(file_path, "w") as file:
+            file.write(template.render(config=self._config))
+        print(f"Test worker isolation generated at {file_path}")
+
+        template = self._env.get_template("pytest_ini_template.jinja2")
+        file_path = os.path.join(os.path.dirname(self._tests_path), "pytest.ini")
+        with open(file_path, "w") as file:
+            file.write(template.render(config=self._config))
+        print(f"Pytest configuration generated at {file_path}")
+
+
+class FastApiTestGenerator(FlaskTestGenerator):
+    def __init__(self, config, psm_model, tests_path):
+        """
+        Initializes the unit test generator for FastAPI backends.
+
+        The generated files follow the same layout as the Flask unit tests, rendered
+        from templates that drive the asynchronous services and the ASGI test client.
+
+        Args:
+            config (ProjectConfiguration): Configuration of the project.
+            psm_model (PsmModel): Platform-Specific Model for the backend.
+            tests_path (str): Path where the test files will be generated.
+        """
+        super().__init__(config, psm_model, tests_path)
+        template_dir = os.path.join(os.path.dirname(__file__), "templates")
+        self._templates_path = template_dir + "/backend/fastapi/tests"
+        self._env = Environment(loader=FileSystemLoader(self._templates_path))
+
+
+class FastApiSecurityTestGenerator(SecurityTestGenerator):
+    def __init__(self, config, psm_model, tests_path):
+        """
+        Initializes the security test generator for FastAPI backends.
+
+        FastAPI specific templates take precedence; the Pyntfile template is shared
+        with the Flask generator.
+
+        Args:
+            config (ProjectConfiguration): Configuration of the project.
+            psm_model (PsmModel): Platform-Specific Model for the backend.
+            tests_path (str): Path where the security test files will be generated.
+        """
+        super().__init__(config, psm_model, tests_path)
+        template_dir = os.path.join(os.path.dirname(__file__), "templates")
+        self._env = Environment(loader=FileSystemLoader([
+            template_dir + "/backend/fastapi/security_tests",
+            self._templates_path,
+        ]))
+
+
+class FastApiIntegrationTestGenerator(IntegrationTestGenerator):
+    def __init__(self, config, psm_model, tests_path):
+        """
+        Initializes the integration test generator for FastAPI backends.
+
+        Args:
+            config (ProjectConfiguration): Configuration of the project.
+            psm_model (PsmModel): Platform-Specific Model for the backend.
+            tests_path (str): Path where the integration test files will be generated.
+        """
+        super().__init__(config, psm_model, tests_path)
+        template_dir = os.path.join(os.path.dirname(__file__), "templates")
+        self._templates_path = template_dir + "/backend/fastapi/integration_tests"
+        self._env = Environment(loader=FileSystemLoader(self._templates_path))
+
+
+class FastApiBenchmarkTestGenerator(BenchmarkTestGenerator):
+    def __init__(self, config, psm_model, tests_path):
+        """
+        Initializes the benchmark generator for FastAPI backends, which await the asynchronous services.
+
+        Args:
+            config (ProjectConfiguration): Configuration of the project.
+            psm_model (PsmModel): Platform-Specific Model for the backend.
+            tests_path (str): Path where the benchmark files will be generated.
+        """
+        super().__init__(config, psm_model, tests_path)
+        template_dir = os.path.join(os.path.dirname(__file__), "templates")
+        self._templates_path = template_dir + "/backend/fastapi/benchmarks"
+        self._env = Environment(loader=FileSystemLoader(self._templates_path))
@@ -0,0 +1,164 @@
+from jinja2 import Environment, FileSystemLoader
+import yaml
+import os
+
+
+class ComposeGenerator:
+    """
+    Generates a docker-compose stack that runs the whole project on one host: the backend
+    replicas behind an nginx load balancer, PostgreSQL and the static frontend.
+    """
+
+    # PostgreSQL settings for a host with SSD storage that also runs the rest of the stack,
+    # any of them can be overridden with the 'postgres' compose settings
+    POSTGRES_SETTINGS = {
+        "shared_buffers": "256MB",
+        "effective_cache_size": "1GB",
+        "work_mem": "16MB",
+        "maintenance_work_mem": "128MB",
+        "wal_buffers": "16MB",
+        "max_wal_size": "2GB",
+        "checkpoint_completion_target": "0.9",
+        "random_page_cost": "1.1",
+        "effective_io_concurrency": "200",
+    }
+
+    # Connections opened by the migrations and by hand, on top of the pools of the replicas
+    RESERVED_CONNECTIONS = 10
+
+    def __init__(self, config, root_path, backend_port=5000):
+        """
+        Initializes the ComposeGenerator.
+
+        Args:
+            config (ProjectConfiguration): Configuration of the project, with its `compose` settings.
+            root_path (str): Root directory of the project, holding the backend and frontend directories.
+            backend_port (int): The port the backend image serves the application on.
+        """
+        self._config = config
+        self._root_path = root_path
+        self._backend_port = backend_port
+        template_dir = os.path.join(os.path.dirname(__file__), "templates")
+        self._templates_path = template_dir + "/compose"
+        self._env = Environment(loader=FileSystemLoader(self._templates_path))
+
+    def generate(self):
+        """
+        Generates the `docker-compose.yml` of the stack and the configuration of its load balancer.
+        """
+        compose = self._config.compose
+        backend_environment = {
+            "APP_CONFIG": "production",
+            "DATABASE_URL": self._database_url(),
+            "WEB_CONCURRENCY": str(compose["workers"]),
+            "SECRET_KEY": "${SECRET_KEY:-change-me}",
+        }
+        if self._config.auth == "jwt":
+            backend_environment["JWT_SECRET_KEY"] = "${JWT_SECRET_KEY:-change-me}"
+        # The stack has a single database, which also serves the reads routed to the replicas
+        for index, _ in enumerate(self._config.backend.database.production_replicas):
+            backend_environment[f"DATABASE_REPLICA_URL_{index}"] = backend_environment["DATABASE_URL"]
+        schema_environment = dict(backend_environment)
+
+        backend = {
+            "build": "./backend",
+            "environment": backend_environment,
+            "depends_on": {"db": {"condition": "service_healthy"}},
+            "deploy": {"replicas": compose["replicas"]},
+            "restart": "unless-stopped",
+        }
+        if self._config.backend.metrics:
+            # The workers of a replica aggregate their metrics through files in a fresh directory
+            backend_environment["PROMETHEUS_MULTIPROC_DIR"] = "/tmp/prometheus"
+            backend["tmpfs"] = ["/tmp/prometheus"]
+
+        services = {
+            "db": {
+                "image": "postgres:16-alpine",
+                "environment": {
+                    "POSTGRES_DB": "app",
+                    "POSTGRES_USER": "app",
+                    "POSTGRES_PASSWORD": "${POSTGRES_PASSWORD:-app}",
+                },
+                "command": ["postgres"] + [argument for name, value in self._postgres_settings().items()
+                                           for argument in ["-c", f"{name}={value}"]],
+                # Docker's default 64MB of shared memory is too little for parallel queries
+                "shm_size": "256mb",
+                "volumes": ["db-data:/var/lib/postgresql/data"],
+                "healthcheck": {
+                    "test": ["CMD-SHELL", "pg_isready -U app -d app"],
+                    "interval": "5s",
+                    "timeout": "3s",
+                    "retries": 10,
+                },
+                "restart": "unless-stopped",
+            },
+        }
+        # The schema is set up once before the replicas start, instead of by all their workers at once
+        if self._config.backend.framework == "flask":
+            schema_service, command = "migrate", ["flask", "--app", "run", "db", "upgrade"]
+        else:
+            schema_service, command = "schema-init", ["python", "init_db.py"]
+            backend_environment["CREATE_SCHEMA"] = "false"
+        services[schema_service] = {
+            "build": "./backend",
+            "command": command,
+            "environment": schema_environment,
+            "depends_on": {"db": {"condition": "service_healthy"}},
+        }
+        backend["depends_on"][schema_service] = {"condition": "service_completed_successfully"}
+        services["backend"] = backend
+        services["frontend"] = {
+            # The frontend calls the API through the load balancer, on its own origin
+            "build": {"context": "./frontend", "args": {"REACT_APP_API_URL": "/api"}},
+            "restart": "unless-stopped",
+        }
+        services["lb"] = {
+            "image": "nginx:1.27-alpine",
+            "ports": [f"{compose['port']}:80"],
+            "volumes": ["./nginx/nginx.conf:/etc/nginx/conf.d/default.conf:ro"],
+            "depends_on": ["backend", "frontend"],
+            "restart": "unless-stopped",
+        }
+
+        stack = {"services": services, "volumes": {"db-data": {}}}
+        compose_path = os.path.join(self._root_path, "docker-compose.yml")
+        with open(compose_path, "w") as file:
+            yaml.dump(stack, file, sort_keys=False, default_flow_style=False)
+        print(f"docker-compose stack generated at {compose_path}")
+
+        nginx_path = os.path.join(self._root_path, "nginx")
+        os.makedirs(nginx_path, exist_ok=True)
+        template = self._env.get_template("nginx_template.jinja2")
+        file_path = os.path.join(nginx_path, "nginx.conf")
+        with open(file_path, "w") as file:
+            file.write(template.render(compose=compose, backend_port=self._backend_port))
+        print(f"Load balancer configuration generated at {file_path}")
+
+    def _database_url(self):
+        """
+        Builds the URL of the stack database for the driver of the backend framework.
+
+        Returns:
+            str: The database URL, with the password read from the environment of compose.
+        """
+        scheme = "postgresql+asyncpg" if self._config.backend.framework == "fastapi" else "postgresql"
+        return f"{scheme}://app:${{POSTGRES_PASSWORD:-app}}@db:5432/app"
+
+    def _postgres_settings(self):
+        """
+        Builds the PostgreSQL settings of the stack, with room for the connection pool of every worker.
+
+        Returns:
+            dict: The settings by name, the compose 'postgres' overrides included.
+        """
+        compose = self._config.compose
+        options = self._config.backend.database.production_options
+        # SQLAlchemy's defaults apply when the production database sets no pool size
+        pool = options.get("pool_size", 5) + options.get("max_overflow", 10)
+        # Every replica bind keeps a pool of its own, on the same database in the stack
+        pool *= 1 + len(self._config.backend.database.production_replicas)
+        settings = dict(self.POSTGRES_SETTINGS)
+        settings["max_connections"] = compose["replicas"] * compose["workers"] * pool + self.RESERVED_CONNECTIONS
+        settings.update(compose["postgres"])
+        return settings
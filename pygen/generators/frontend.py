@@ -172,7 +172,8 @@ class ReactFrontendGenerator(FrontendGenerator, ABC):
         self._generate_views()
         self._test_generator.generate()
         config = {
-            "base_image": "node:16-alpine",
+            "base_image": "node:20-alpine",
+            "runtime_image": "alpine:3.20",
             "build_dir": "build"
         }
         generator = FrontendDockerfileGenerator(self._path, config)
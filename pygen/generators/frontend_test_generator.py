@@ -24,9 +24,12 @@ class ReactTestGenerator:
         """
         os.makedirs(self._tests_path, exist_ok=True)
 
-        for component in self._psm_model.components:
-            self._generate_component_tests(component)
-            self._generate_view_tests(component)
+        if self._config.test_layout == "consolidated":
+            self._generate_consolidated_tests()
+        else:
+            for component in self._psm_model.components:
+                self._generate_component_tests(component)
+                self._generate_view_tests(component)
 
         self._generate_routing_tests()
 
@@ -59,6 +62,20 @@ class ReactTestGenerator:
             file.write(rendered)
         print(f"Test generated for the view {component.name} at {file_path}")
 
+    def _generate_consolidated_tests(self):
+        """
+        Generates a single test file per kind of component, whose tests run over a table with a row
+        per component through `test.each`.
+        """
+        components = [component.to_dict() for component in self._psm_model.components]
+        for kind in ["Table", "Form", "View"]:
+            template = self._env.get_template(f"consolidated/{kind.lower()}_test_template.jinja2")
+            rendered = template.render(components=components)
+            file_path = os.path.join(self._tests_path, f"{kind}s.test.js")
+            with open(file_path, "w") as file:
+                file.write(rendered)
+            print(f"Consolidated {kind} tests generated at {file_path}")
+
     def _generate_routing_tests(self):
         """
         Generates tests for the main routes defined in `App.js`.
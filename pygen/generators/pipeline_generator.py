@@ -8,6 +8,22 @@ class PipelineGenerator(ABC):
     Abstract base class for CI pipelines.
     """
 
+    # Number of parallel shards each backend test suite is split into (see tests/conftest.py)
+    TEST_SHARDS = {"unit": 2, "security": 1, "integration": 2}
+
+    @classmethod
+    def _test_shards(cls):
+        """
+        Lists the shards of the backend test suites, which run as a matrix of parallel jobs.
+
+        Returns:
+            list: Dictionaries with the 'suite', the shard 'index' and the shard 'count'.
+        """
+        return [
+            {"suite": suite, "index": index, "count": count}
+            for suite, count in cls.TEST_SHARDS.items() for index in range(count)
+        ]
+
     @abstractmethod
     def generate_backend_pipeline(self, output_path):
         """
@@ -38,106 +54,228 @@ class AzureDevOpsPipelineGenerator(PipelineGenerator):
         """
         Generates the YAML configuration for the backend CI in Azure DevOps.
 
+        An install stage builds the virtual environment and saves it in the pipeline cache. The
+        test shards and the scanners then run as parallel jobs that restore it.
+
         Args:
             output_path (str): Path where the backend pipeline configuration will be saved.
         """
         pipeline = {
             "trigger": {"branches": {"include": ["main"]}},
             "pool": {"name": "pc"},
-            "steps": [
-                {
-                    "task": "UsePythonVersion@0",
-                    "inputs": {"versionSpec": "3.10", "addToPath": True},
-                },
-                {
-                    "script": "python -m pip install --upgrade pip\n"
-                              "pip install -r requirements.txt\n"
-                              "pip install bandit pip-audit junit-xml\n"
-                              "pip install git+https://gabrielmartinez945@dev.azure.com/gabrielmartinez945/pip_audit_to_junit/_git/pip_audit_to_junit",
-                    "displayName": "Install dependencies and tools",
-                },
+            "variables": {"PIP_CACHE_DIR": "$(Pipeline.Workspace)/.pip"},
+            "stages": [
                 {
-                    "script": "PYTHONPATH=$(System.DefaultWorkingDirectory) pytest tests/unit --junitxml=test-results.xml",
-                    "displayName": "Run unit tests",
-                },
-                {
-                    "task": "PublishTestResults@2",
-                    "inputs": {
-                        "testResultsFormat": "JUnit",
-                        "testResultsFiles": "**/test-results.xml",
-                        "failTaskOnFailedTests": True,
-                        "testRunTitle": "Unit Test Results",
-                    },
-                    "displayName": "Publish unit test results",
-                },
-                {
-                    "script": "PYTHONPATH=$(System.DefaultWorkingDirectory) pytest tests/security --junitxml=test-results.xml",
-                    "displayName": "Run security tests",
+                    "stage": "install",
+                    "displayName": "Install",
+                    "jobs": [
+                        {
+                            "job": "install",
+                            "displayName": "Install dependencies and tools",
+                            "steps": self._python_environment_steps(),
+                        },
+                    ],
                 },
                 {
-                    "task": "PublishTestResults@2",
-                    "inputs": {
-                        "testResultsFormat": "JUnit",
-                        "testResultsFiles": "**/test-results.xml",
-                        "failTaskOnFailedTests": True,
-                        "testRunTitle": "Security Test Results",
-                    },
-                    "displayName": "Publish security test results",
+                    "stage": "verify",
+                    "displayName": "Test and analyse",
+                    "dependsOn": "install",
+                    "jobs": [
+                        {
+                            "job": "tests",
+                            "displayName": "Run tests",
+                            "strategy": {
+                                "matrix": {
+                                    f"{shard['suite']}_{shard['index'] + 1}": {
+                                        "suite": shard["suite"],
+                                        "shardIndex": shard["index"],
+                                        "shardCount": shard["count"],
+                                    }
+                                    for shard in self._test_shards()
+                                },
+                            },
+                            "steps": self._python_environment_steps() + [
+                                {
+                                    "task": "Cache@2",
+                                    "inputs": {
+                                        "key": 'pytest | "$(Agent.OS)" | "$(suite)" | "$(shardIndex)" '
+                                               '| "$(Build.SourceVersion)"',
+                                        "restoreKeys": 'pytest | "$(Agent.OS)" | "$(suite)" | "$(shardIndex)"',
+                                        "path": ".pytest_cache",
+                                    },
+                                    "displayName": "Cache pytest state",
+                                },
+                                {
+                                    "script": "PYTHONPATH=$(System.DefaultWorkingDirectory) pytest tests/$(suite) "
+                                              "-n auto --failed-first --junitxml=test-results.xml",
+                                    "env": {
+                                        "TEST_SHARD_INDEX": "$(shardIndex)",
+                                        "TEST_SHARD_COUNT": "$(shardCount)",
+                                    },
+                                    "displayName": "Run $(suite) tests",
+                                },
+                                {
+                                    "task": "PublishTestResults@2",
+                                    "inputs": {
+                                        "testResultsFormat": "JUnit",
+                                        "testResultsFiles": "**/test-results.xml",
+                                        "failTaskOnFailedTests": True,
+                                        "testRunTitle": "$(suite) Test Results (shard $(shardIndex))",
+                                    },
+                                    "displayName": "Publish $(suite) test results",
+                                },
+                            ],
+                        },
+                        {
+                            "job": "bandit",
+                            "displayName": "Bandit security analysis",
+                            "steps": self._python_environment_steps() + [
+                                {
+                                    "script": "bandit -r . -x ./.venv -f xml -o bandit-report.xml || true",
+                                    "displayName": "Run Bandit security analysis",
+                                },
+                                {
+                                    "task": "PublishTestResults@2",
+                                    "inputs": {
+                                        "testResultsFormat": "JUnit",
+                                        "testResultsFiles": "**/bandit-report.xml",
+                                        "failTaskOnFailedTests": False,
+                                        "testRunTitle": "Bandit Security Analysis",
+                                    },
+                                    "displayName": "Publish Bandit results",
+                                },
+                            ],
+                        },
+                        {
+                            "job": "pip_audit",
+                            "displayName": "Dependency CVE analysis",
+                            "steps": self._python_environment_steps() + [
+                                {
+                                    "script": "pip-audit -r requirements.txt -f json -o pip-audit-report.json || true",
+                                    "displayName": "Run pip-audit for dependency CVEs",
+                                },
+                                {
+                                    "script": "pip-audit-to-junit pip-audit-report.json pip-audit-report.xml",
+                                    "displayName": "Convert pip-audit JSON to JUnit XML",
+                                },
+                                {
+                                    "task": "PublishTestResults@2",
+                                    "inputs": {
+                                        "testResultsFormat": "JUnit",
+                                        "testResultsFiles": "**/pip-audit-report.xml",
+                                        "failTaskOnFailedTests": True,
+                                        "testRunTitle": "Dependency CVE Analysis",
+                                    },
+                                    "displayName": "Publish pip-audit results",
+                                },
+                            ],
+                        },
+                    ],
                 },
                 {
-                    "script": "PYTHONPATH=$(System.DefaultWorkingDirectory) pytest tests/integration --junitxml=test-results.xml",
-                    "displayName": "Run integration tests",
+                    "stage": "image",
+                    "displayName": "Build image",
+                    "dependsOn": [],
+                    "jobs": [self._image_job("backend", "requirements.txt")],
                 },
-                {
-                    "task": "PublishTestResults@2",
-                    "inputs": {
-                        "testResultsFormat": "JUnit",
-                        "testResultsFiles": "**/test-results.xml",
-                        "failTaskOnFailedTests": True,
-                        "testRunTitle": "Integration Test Results",
-                    },
-                    "displayName": "Publish integration test results",
+            ],
+        }
+
+        with open(output_path, "w") as file:
+            yaml.dump(pipeline, file, sort_keys=False, default_flow_style=False)
+
+        print(f"Azure DevOps backend CI pipeline configuration generated at {output_path}")
+
+    @staticmethod
+    def _python_environment_steps():
+        """
+        Builds the steps that restore the cached virtual environment of the backend, installing
+        it only when the cache misses, and put it on the PATH of the job.
+
+        Returns:
+            list: The steps of the job.
+        """
+        return [
+            {
+                "task": "UsePythonVersion@0",
+                "inputs": {"versionSpec": "3.10", "addToPath": True},
+            },
+            {
+                "task": "Cache@2",
+                "inputs": {
+                    "key": 'venv | "$(Agent.OS)" | "3.10" | requirements.txt | requirements-dev.txt',
+                    "path": ".venv",
+                    "cacheHitVar": "VENV_RESTORED",
                 },
-                {
-                    "script": "bandit -r . -f xml -o bandit-report.xml || true",
-                    "displayName": "Run Bandit security analysis",
+                "displayName": "Cache virtual environment",
+            },
+            {
+                "task": "Cache@2",
+                "inputs": {
+                    "key": 'pip | "$(Agent.OS)" | requirements.txt | requirements-dev.txt',
+                    "restoreKeys": 'pip | "$(Agent.OS)"',
+                    "path": "$(PIP_CACHE_DIR)",
                 },
+                "condition": "ne(variables.VENV_RESTORED, 'true')",
+                "displayName": "Cache pip downloads",
+            },
+            {
+                "script": "python -m venv .venv\n"
+                          ".venv/bin/python -m pip install --upgrade pip\n"
+                          ".venv/bin/pip install -r requirements-dev.txt\n"
+                          ".venv/bin/pip install bandit pip-audit junit-xml\n"
+                          ".venv/bin/pip install git+https://gabrielmartinez945@dev.azure.com/gabrielmartinez945/pip_audit_to_junit/_git/pip_audit_to_junit",
+                "condition": "ne(variables.VENV_RESTORED, 'true')",
+                "displayName": "Install dependencies and tools",
+            },
+            {
+                "script": 'echo "##vso[task.prependpath]$(System.DefaultWorkingDirectory)/.venv/bin"',
+                "displayName": "Activate virtual environment",
+            },
+        ]
+
+    @staticmethod
+    def _image_job(image, dependency_file):
+        """
+        Builds the job that builds the Docker image of a project with BuildKit.
+
+        The layer cache is kept in the pipeline cache under the Dockerfile and the dependency file,
+        so commits that only change the source restore the dependency layers as they are.
+
+        Args:
+            image (str): Name of the image.
+            dependency_file (str): File listing the dependencies installed by the Dockerfile.
+
+        Returns:
+            dict: The job.
+        """
+        return {
+            "job": "build_image",
+            "displayName": "Build Docker image",
+            "steps": [
                 {
-                    "task": "PublishTestResults@2",
+                    "task": "Cache@2",
                     "inputs": {
-                        "testResultsFormat": "JUnit",
-                        "testResultsFiles": "**/bandit-report.xml",
-                        "failTaskOnFailedTests": False,
-                        "testRunTitle": "Bandit Security Analysis",
+                        "key": f'docker | "$(Agent.OS)" | Dockerfile | {dependency_file}',
+                        "restoreKeys": 'docker | "$(Agent.OS)" | Dockerfile',
+                        "path": "$(Pipeline.Workspace)/.buildx-cache",
                     },
-                    "displayName": "Publish Bandit results",
-                },
-                {
-                    "script": "pip-audit -r requirements.txt -f json -o pip-audit-report.json || true",
-                    "displayName": "Run pip-audit for dependency CVEs",
+                    "displayName": "Cache Docker layers",
                 },
                 {
-                    "script": "pip-audit-to-junit pip-audit-report.json pip-audit-report.xml",
-                    "displayName": "Convert pip-audit JSON to JUnit XML",
-                },
-                {
-                    "task": "PublishTestResults@2",
-                    "inputs": {
-                        "testResultsFormat": "JUnit",
-                        "testResultsFiles": "**/pip-audit-report.xml",
-                        "failTaskOnFailedTests": True,
-                        "testRunTitle": "Dependency CVE Analysis",
-                    },
-                    "displayName": "Publish pip-audit results",
+                    "script": "docker buildx create --use --driver docker-container\n"
+                              f"docker buildx build --tag {image}:$(Build.SourceVersion) "
+                              "--cache-from type=local,src=$(Pipeline.Workspace)/.buildx-cache "
+                              "--cache-to type=local,dest=$(Pipeline.Workspace)/.buildx-cache-new,mode=max .\n"
+                              # Replacing the cache drops the layers of previous builds instead of piling them up
+                              "rm -rf $(Pipeline.Workspace)/.buildx-cache\n"
+                              "mv $(Pipeline.Workspace)/.buildx-cache-new $(Pipeline.Workspace)/.buildx-cache",
+                    "env": {"DOCKER_BUILDKIT": "1"},
+                    "displayName": "Build image with BuildKit",
                 },
             ],
         }
 
-        with open(output_path, "w") as file:
-            yaml.dump(pipeline, file, sort_keys=False, default_flow_style=False)
-
-        print(f"Azure DevOps backend CI pipeline configuration generated at {output_path}")
-
     def generate_frontend_pipeline(self, output_path):
         """
         Generates the YAML configuration for the frontend CI in Azure DevOps.
@@ -148,55 +286,81 @@ class AzureDevOpsPipelineGenerator(PipelineGenerator):
         pipeline = {
             "trigger": {"branches": {"include": ["main"]}},
             "pool": {"name": "pc"},
-            "steps": [
-                {"script": "npm install", "displayName": "Install Dependencies"},
-                {"script": "npm run build", "displayName": "Build Frontend"},
-                {
-                    "script": "npm test -- --reporters jest-junit --outputFile=jest-test-results.xml",
-                    "displayName": "Run Frontend Tests and Generate Report",
-                },
-                {
-                    "task": "PublishTestResults@2",
-                    "inputs": {
-                        "testResultsFormat": "JUnit",
-                        "testResultsFiles": "**/jest-test-results.xml",
-                        "failTaskOnFailedTests": True,
-                        "testRunTitle": "Frontend Test Results",
-                    },
-                    "displayName": "Publish Frontend Test Results",
-                },
-                {
-                    "script": "npm audit --json > npm-audit-report.json || true",
-                    "displayName": "Run Dependency Security Analysis (npm audit)",
-                },
-                {
-                    "script": (
-                        "npm install -g audit-ci\n"
-                        "audit-ci --json > audit-ci-report.json || true"
-                    ),
-                    "displayName": "Run Dependency Security Analysis (audit-ci)",
-                },
-                {
-                    "script": (
-                        "zap-cli start\n"
-                        "zap-cli quick-scan http://localhost:3000 > zap-scan-report.json || true\n"
-                        "zap-cli shutdown"
-                    ),
-                    "displayName": "Run OWASP ZAP Security Scan",
-                },
+            "variables": {"npm_config_cache": "$(Pipeline.Workspace)/.npm"},
+            "jobs": [
                 {
-                    "task": "PublishTestResults@2",
-                    "inputs": {
-                        "testResultsFormat": "JUnit",
-                        "testResultsFiles": "**/zap-scan-report.json",
-                        "failTaskOnFailedTests": False,
-                        "testRunTitle": "OWASP ZAP Security Scan Results",
-                    },
-                    "displayName": "Publish OWASP ZAP Scan Results",
+                    "job": "build_frontend",
+                    "displayName": "Build and test",
+                    "steps": [
+                        {
+                            "task": "Cache@2",
+                            "inputs": {
+                                "key": 'npm | "$(Agent.OS)" | package-lock.json',
+                                "restoreKeys": 'npm | "$(Agent.OS)"',
+                                "path": "$(npm_config_cache)",
+                            },
+                            "displayName": "Cache npm packages",
+                        },
+                        {"script": "npm ci", "displayName": "Install Dependencies"},
+                        {
+                            "task": "Cache@2",
+                            "inputs": {
+                                "key": 'build | "$(Agent.OS)" | package-lock.json | "$(Build.SourceVersion)"',
+                                "restoreKeys": 'build | "$(Agent.OS)" | package-lock.json',
+                                "path": "node_modules/.cache",
+                            },
+                            "displayName": "Cache build and jest state",
+                        },
+                        {"script": "npm run build", "displayName": "Build Frontend"},
+                        {
+                            "script": "npm test -- --reporters jest-junit --outputFile=jest-test-results.xml "
+                                      "--cacheDirectory=node_modules/.cache/jest",
+                            "displayName": "Run Frontend Tests and Generate Report",
+                        },
+                        {
+                            "task": "PublishTestResults@2",
+                            "inputs": {
+                                "testResultsFormat": "JUnit",
+                                "testResultsFiles": "**/jest-test-results.xml",
+                                "failTaskOnFailedTests": True,
+                                "testRunTitle": "Frontend Test Results",
+                            },
+                            "displayName": "Publish Frontend Test Results",
+                        },
+                        {
+                            "script": "npm audit --json > npm-audit-report.json || true",
+                            "displayName": "Run Dependency Security Analysis (npm audit)",
+                        },
+                        {
+                            "script": (
+                                "npm install -g audit-ci\n"
+                                "audit-ci --json > audit-ci-report.json || true"
+                            ),
+                            "displayName": "Run Dependency Security Analysis (audit-ci)",
+                        },
+                        {
+                            "script": (
+                                "zap-cli start\n"
+                                "zap-cli quick-scan http://localhost:3000 > zap-scan-report.json || true\n"
+                                "zap-cli shutdown"
+                            ),
+                            "displayName": "Run OWASP ZAP Security Scan",
+                        },
+                        {
+                            "task": "PublishTestResults@2",
+                            "inputs": {
+                                "testResultsFormat": "JUnit",
+                                "testResultsFiles": "**/zap-scan-report.json",
+                                "failTaskOnFailedTests": False,
+                                "testRunTitle": "OWASP ZAP Security Scan Results",
+                            },
+                            "displayName": "Publish OWASP ZAP Scan Results",
+                        },
+                    ],
                 },
+                self._image_job("frontend", "package-lock.json"),
             ],
         }
-
         with open(output_path, "w") as file:
             yaml.dump(pipeline, file, sort_keys=False, default_flow_style=False)
 
@@ -208,10 +372,16 @@ class GithubActionsPipelineGenerator(PipelineGenerator):
     CI pipeline generator for GitHub Actions.
     """
 
+    # The install job saves the virtual environment under this key and the other jobs restore it
+    VENV_CACHE_KEY = "venv-${{ runner.os }}-3.10-${{ hashFiles('requirements.txt', 'requirements-dev.txt') }}"
+
     def generate_backend_pipeline(self, output_path):
         """
         Generates the YAML workflow configuration for the backend CI in GitHub Actions.
 
+        An install job builds the virtual environment and saves it in the Actions cache. The
+        test shards and the scanners then run as parallel jobs that restore it.
+
         Args:
             output_path (str): Path where the backend pipeline configuration will be saved.
         """
@@ -222,7 +392,7 @@ class GithubActionsPipelineGenerator(PipelineGenerator):
                 "pull_request": {"branches": ["main"]},
             },
             "jobs": {
-                "build_backend": {
+                "install": {
                     "runs-on": "ubuntu-latest",
                     "steps": [
                         {"uses": "actions/checkout@v2"},
@@ -231,52 +401,81 @@ class GithubActionsPipelineGenerator(PipelineGenerator):
                             "with": {"python-version": "3.10"},
                         },
                         {
-                            "run": (
-                                "python -m pip install --upgrade pip\n"
-                                "pip install -r requirements.txt\n"
-                                "pip install bandit pip-audit junit-xml\n"
-                                "pip install git+https://gabrielmartinez945@dev.azure.com/gabrielmartinez945/pip_audit_to_junit/_git/pip_audit_to_junit"
-                            ),
-                            "name": "Install dependencies and tools",
-                        },
-                        {
-                            "run": "PYTHONPATH=$(pwd) pytest tests/unit --junitxml=unit-test-results.xml",
-                            "name": "Run unit tests",
+                            "uses": "actions/cache@v4",
+                            "id": "venv-cache",
+                            "with": {"path": ".venv", "key": self.VENV_CACHE_KEY},
+                            "name": "Cache virtual environment",
                         },
                         {
-                            "uses": "actions/upload-artifact@v2",
+                            "uses": "actions/cache@v4",
+                            "if": "steps.venv-cache.outputs.cache-hit != 'true'",
                             "with": {
-                                "name": "Unit Test Results",
-                                "path": "unit-test-results.xml",
+                                "path": "~/.cache/pip",
+                                "key": "pip-${{ runner.os }}-${{ hashFiles('requirements.txt', 'requirements-dev.txt') }}",
+                                "restore-keys": "pip-${{ runner.os }}-",
                             },
-                            "name": "Upload unit test results",
+                            "name": "Cache pip downloads",
                         },
                         {
-                            "run": "PYTHONPATH=$(pwd) pytest tests/security --junitxml=security-test-results.xml",
-                            "name": "Run security tests",
+                            "run": (
+                                "python -m venv .venv\n"
+                                ".venv/bin/python -m pip install --upgrade pip\n"
+                                ".venv/bin/pip install -r requirements-dev.txt\n"
+                                ".venv/bin/pip install bandit pip-audit junit-xml\n"
+                                ".venv/bin/pip install git+https://gabrielmartinez945@dev.azure.com/gabrielmartinez945/pip_audit_to_junit/_git/pip_audit_to_junit"
+                            ),
+                            "if": "steps.venv-cache.outputs.cache-hit != 'true'",
+                            "name": "Install dependencies and tools",
                         },
+                    ],
+                },
+                "tests": {
+                    "needs": "install",
+                    "runs-on": "ubuntu-latest",
+                    "strategy": {
+                        "fail-fast": False,
+                        "matrix": {
+                            "include": [
+                                {"suite": shard["suite"], "shard": shard["index"], "shards": shard["count"]}
+                                for shard in self._test_shards()
+                            ],
+                        },
+                    },
+                    "steps": self._python_environment_steps() + [
                         {
-                            "uses": "actions/upload-artifact@v2",
+                            "uses": "actions/cache@v4",
                             "with": {
-                                "name": "Security Test Results",
-                                "path": "security-test-results.xml",
+                                "path": ".pytest_cache",
+                                "key": "pytest-${{ runner.os }}-${{ matrix.suite }}-${{ matrix.shard }}-${{ github.sha }}",
+                                "restore-keys": "pytest-${{ runner.os }}-${{ matrix.suite }}-${{ matrix.shard }}-",
                             },
-                            "name": "Upload security test results",
+                            "name": "Cache pytest state",
                         },
                         {
-                            "run": "PYTHONPATH=$(pwd) pytest tests/integration --junitxml=integration-test-results.xml",
-                            "name": "Run integration tests",
+                            "run": "PYTHONPATH=$(pwd) pytest tests/${{ matrix.suite }} -n auto --failed-first "
+                                   "--junitxml=${{ matrix.suite }}-test-results.xml",
+                            "env": {
+                                "TEST_SHARD_INDEX": "${{ matrix.shard }}",
+                                "TEST_SHARD_COUNT": "${{ matrix.shards }}",
+                            },
+                            "name": "Run ${{ matrix.suite }} tests",
                         },
                         {
                             "uses": "actions/upload-artifact@v2",
                             "with": {
-                                "name": "Integration Test Results",
-                                "path": "integration-test-results.xml",
+                                "name": "${{ matrix.suite }} Test Results (shard ${{ matrix.shard }})",
+                                "path": "${{ matrix.suite }}-test-results.xml",
                             },
-                            "name": "Upload integration test results",
+                            "name": "Upload ${{ matrix.suite }} test results",
                         },
+                    ],
+                },
+                "bandit": {
+                    "needs": "install",
+                    "runs-on": "ubuntu-latest",
+                    "steps": self._python_environment_steps() + [
                         {
-                            "run": "bandit -r . -f xml -o bandit-report.xml || true",
+                            "run": "bandit -r . -x ./.venv -f xml -o bandit-report.xml || true",
                             "name": "Run Bandit security analysis",
                         },
                         {
@@ -287,6 +486,12 @@ class GithubActionsPipelineGenerator(PipelineGenerator):
                             },
                             "name": "Upload Bandit security analysis results",
                         },
+                    ],
+                },
+                "pip_audit": {
+                    "needs": "install",
+                    "runs-on": "ubuntu-latest",
+                    "steps": self._python_environment_steps() + [
                         {
                             "run": "pip-audit -r requirements.txt -f json -o pip-audit-report.json || true",
                             "name": "Run pip-audit for dependency CVEs",
@@ -304,7 +509,8 @@ class GithubActionsPipelineGenerator(PipelineGenerator):
                             "name": "Upload pip-audit results",
                         },
                     ],
-                }
+                },
+                "build_image": self._image_job("backend"),
             },
         }
 
@@ -313,6 +519,65 @@ class GithubActionsPipelineGenerator(PipelineGenerator):
 
         print(f"GitHub Actions backend CI workflow configuration generated at {output_path}")
 
+    @classmethod
+    def _python_environment_steps(cls):
+        """
+        Builds the steps that restore the virtual environment saved by the install job and put it
+        on the PATH of the job.
+
+        Returns:
+            list: The steps of the job.
+        """
+        return [
+            {"uses": "actions/checkout@v2"},
+            {
+                "uses": "actions/setup-python@v2",
+                "with": {"python-version": "3.10"},
+            },
+            {
+                "uses": "actions/cache/restore@v4",
+                "with": {"path": ".venv", "key": cls.VENV_CACHE_KEY, "fail-on-cache-miss": True},
+                "name": "Restore virtual environment",
+            },
+            {
+                "run": 'echo "$(pwd)/.venv/bin" >> "$GITHUB_PATH"',
+                "name": "Activate virtual environment",
+            },
+        ]
+
+    @staticmethod
+    def _image_job(image):
+        """
+        Builds the job that builds the Docker image of a project with BuildKit.
+
+        The layers are exported to and imported from the GitHub Actions cache, so commits that only
+        change the source reuse the dependency layers of the previous build.
+
+        Args:
+            image (str): Name of the image, also used as the scope of its layer cache.
+
+        Returns:
+            dict: The job.
+        """
+        return {
+            "runs-on": "ubuntu-latest",
+            "steps": [
+                {"uses": "actions/checkout@v2"},
+                {"uses": "docker/setup-buildx-action@v3", "name": "Set up Docker Buildx"},
+                {
+                    "uses": "docker/build-push-action@v6",
+                    "with": {
+                        "context": ".",
+                        "push": False,
+                        "tags": f"{image}:${{{{ github.sha }}}}",
+                        "cache-from": f"type=gha,scope={image}",
+                        "cache-to": f"type=gha,scope={image},mode=max",
+                    },
+                    "name": "Build image with BuildKit",
+                },
+            ],
+        }
+
     def generate_frontend_pipeline(self, output_path):
         """
         Generates the YAML workflow configuration for the frontend CI in GitHub Actions.
@@ -331,10 +596,29 @@ class GithubActionsPipelineGenerator(PipelineGenerator):
                     "runs-on": "ubuntu-latest",
                     "steps": [
                         {"uses": "actions/checkout@v2"},
-                        {"run": "npm install", "name": "Install Dependencies"},
+                        {
+                            "uses": "actions/cache@v4",
+                            "with": {
+                                "path": "~/.npm",
+                                "key": "npm-${{ runner.os }}-${{ hashFiles('package-lock.json') }}",
+                                "restore-keys": "npm-${{ runner.os }}-",
+                            },
+                            "name": "Cache npm packages",
+                        },
+                        {"run": "npm ci", "name": "Install Dependencies"},
+                        {
+                            "uses": "actions/cache@v4",
+                            "with": {
+                                "path": "node_modules/.cache",
+                                "key": "build-${{ runner.os }}-${{ hashFiles('package-lock.json') }}-${{ github.sha }}",
+                                "restore-keys": "build-${{ runner.os }}-${{ hashFiles('package-lock.json') }}-",
+                            },
+                            "name": "Cache build and jest state",
+                        },
                         {"run": "npm run build", "name": "Build Frontend"},
                         {
-                            "run": "npm test -- --reporters jest-junit --outputFile=jest-test-results.xml",
+                            "run": "npm test -- --reporters jest-junit --outputFile=jest-test-results.xml "
+                                   "--cacheDirectory=node_modules/.cache/jest",
                             "name": "Run Frontend Tests and Generate Report",
                         },
                         {
@@ -370,7 +654,8 @@ class GithubActionsPipelineGenerator(PipelineGenerator):
                             "name": "Upload OWASP ZAP Scan Report",
                         },
                     ],
-                }
+                },
+                "build_image": self._image_job("frontend"),
             },
         }
 
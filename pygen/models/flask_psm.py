@@ -46,11 +46,12 @@ class Field:
 
 class Relationship:
     """Represents a relationship between resources in the PSM model."""
-    def __init__(self, name, target, rel_type, back_populates=None):
+    def __init__(self, name, target, rel_type, back_populates=None, secondary_table=None):
         self._name = name
         self._target = target
         self._type = rel_type
         self._back_populates = back_populates
+        self._secondary_table = secondary_table
 
 
     @property
@@ -69,6 +70,10 @@ class Relationship:
     def back_populates(self):
         return self._back_populates
 
+    @property
+    def secondary_table(self):
+        return self._secondary_table
+
     def to_dict(self):
         """Converts the relationship to a dictionary."""
         return {
@@ -76,13 +81,68 @@ class Relationship:
             "target": self.target,
             "type": self.type,
             "back_populates": self.back_populates,
+            "secondary_table": self.secondary_table,
             "source": self.source,
             "target_relationship_name": self.target_relationship_name,
         }
 
     def __repr__(self):
         return (f"Relationship(name={self._name}, target={self._target}, "
-                f"type={self._type}, back_populates={self._back_populates}")
+                f"type={self._type}, back_populates={self._back_populates}, "
+                f"secondary_table={self._secondary_table}")
+
+
+class AssociationTable:
+    """
+    Represents the association table of a many-to-many relationship in the PSM model.
+
+    The table has a composite primary key (left_column, right_column) and a reverse
+    index (right_column, left_column), so both sides of the relationship are joined by index.
+    """
+    def __init__(self, name, left_column, left_foreign_key, right_column, right_foreign_key):
+        self._name = name
+        self._left_column = left_column
+        self._left_foreign_key = left_foreign_key
+        self._right_column = right_column
+        self._right_foreign_key = right_foreign_key
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def left_column(self):
+        return self._left_column
+
+    @property
+    def left_foreign_key(self):
+        return self._left_foreign_key
+
+    @property
+    def right_column(self):
+        return self._right_column
+
+    @property
+    def right_foreign_key(self):
+        return self._right_foreign_key
+
+    @property
+    def reverse_index(self):
+        return f"ix_{self._name}_{self._right_column}"
+
+    def to_dict(self):
+        """Converts the association table to a dictionary."""
+        return {
+            "name": self.name,
+            "left_column": self.left_column,
+            "left_foreign_key": self.left_foreign_key,
+            "right_column": self.right_column,
+            "right_foreign_key": self.right_foreign_key,
+        }
+
+    def __repr__(self):
+        return (f"AssociationTable(name={self._name}, left_column={self._left_column}, "
+                f"right_column={self._right_column})")
 
 
 class Entity:
@@ -114,9 +174,9 @@ class Entity:
         field = Field(name, field_type, primary_key, foreign_key, nullable)
         self._fields.append(field)
 
-    def add_relationship(self, name, target, rel_type, back_populates=None):
+    def add_relationship(self, name, target, rel_type, back_populates=None, secondary_table=None):
         """Adds a relationship to the entity."""
-        relationship = Relationship(name, target, rel_type, back_populates)
+        relationship = Relationship(name, target, rel_type, back_populates, secondary_table)
         self._relationships.append(relationship)
 
     def to_dict(self):
@@ -137,15 +197,109 @@ class PsmModel:
     """Represents the entire PSM model."""
     def __init__(self):
         self._entities = []
+        self._association_tables = []
 
     @property
     def entities(self):
         return self._entities
 
+    @property
+    def association_tables(self):
+        return self._association_tables
+
     def add_entity(self, entity):
         """Adds an entity to the model."""
         self._entities.append(entity)
 
+    def add_association_table(self, association_table):
+        """Adds the association table of a many-to-many relationship to the model."""
+        self._association_tables.append(association_table)
+
+    def sort_entities_by_dependencies(self):
+        """
+        Orders the entities so that every table is created after the tables it references.
+
+        Returns:
+            tuple(list, list):
+            - First element: The entities in creation order.
+            - Second element: (table name, field name) pairs of the foreign keys that close a cycle
+              and must be added once all the tables exist.
+        """
+        pending = list(self._entities)
+        created = set()
+        ordered = []
+        deferred_foreign_keys = []
+        while pending:
+            for entity in pending:
+                references = {field.foreign_key.split('.')[0] for field in entity.fields if field.foreign_key}
+                if references <= created | {entity.table_name}:
+                    break
+            else:
+                # Every pending table waits on another one: break the cycle at the first table
+                entity = pending[0]
+                deferred_foreign_keys.extend(
+                    (entity.table_name, field.name) for field in entity.fields
+                    if field.foreign_key and field.foreign_key.split('.')[0] not in created | {entity.table_name}
+                )
+            pending.remove(entity)
+            created.add(entity.table_name)
+            ordered.append(entity)
+        return ordered, deferred_foreign_keys
+
+    def get_entity(self, name):
+        """Returns the entity with the given name, or None if it does not exist."""
+        return next((entity for entity in self._entities if entity.name == name), None)
+
+    def nested_relationship_paths(self, entity, excluded=None, visited=None):
+        """
+        Lists the relationship paths that the schema of an entity dumps as nested objects.
+
+        A nested schema excludes the relationship that points back to its parent, so the paths
+        follow the same rule. They are used to eager load everything a dump will read.
+
+        Args:
+            entity (Entity): The entity whose schema is dumped.
+            excluded (str, optional): Relationship of `entity` excluded by its parent schema.
+            visited (set, optional): Names of the entities already in the path, to stop on cycles.
+
+        Returns:
+            list: One list of (entity name, relationship name) pairs per path, from `entity` to a leaf.
+        """
+        visited = (visited or set()) | {entity.name}
+        paths = []
+        for relationship in entity.relationships:
+            if relationship.name == excluded:
+                continue
+            step = [(entity.name, relationship.name)]
+            target = self.get_entity(relationship.target)
+            if target is None or target.name in visited:
+                paths.append(step)
+                continue
+            if relationship.type in ["one-to-many", "many-to-many"]:
+                if relationship.type == "many-to-many" and relationship.back_populates:
+                    back_reference = relationship.back_populates
+                else:
+                    back_reference = entity.name.lower()
+            else:
+                back_reference = (relationship.back_populates or "").lower()
+            sub_paths = self.nested_relationship_paths(target, back_reference, visited)
+            paths.extend([step + sub_path for sub_path in sub_paths] or [step])
+        return paths
+
+    def related_relationship_paths(self, entity, relationship):
+        """
+        Lists the relationship paths read when the records of a relationship of an entity are dumped.
+
+        The related records are dumped with the full schema of their entity, so nothing is excluded.
+
+        Returns:
+            list: One list of (entity name, relationship name) pairs per path, starting with `relationship`.
+        """
+        step = [(entity.name, relationship.name)]
+        target = self.get_entity(relationship.target)
+        sub_paths = self.nested_relationship_paths(target) if target is not None else []
+        return [step + sub_path for sub_path in sub_paths] or [step]
+
     def to_yaml(self, file_path=None):
         """
         Exports the PSM model to a YAML format.
@@ -157,7 +311,8 @@ class PsmModel:
             str: The YAML representation of the model if `file_path` is None.
         """
         model_dict = {
-            "entities": [entity.to_dict() for entity in self.entities]
+            "entities": [entity.to_dict() for entity in self.entities],
+            "association_tables": [table.to_dict() for table in self.association_tables]
         }
         yaml_output = yaml.dump(model_dict, sort_keys=False, default_flow_style=False)
 
@@ -168,4 +323,4 @@ class PsmModel:
             return yaml_output
 
     def __repr__(self):
-        return f"Model(entities={self.entities})"
+        return f"Model(entities={self.entities}, association_tables={self.association_tables})"
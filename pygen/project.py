@@ -2,6 +2,7 @@ import os
 import subprocess
 import sys
 from pygen.generators.backend import MonolithicBackendGenerator
+from pygen.generators.compose_generator import ComposeGenerator
 from pygen.generators.frontend import ReactFrontendGenerator
 
 
@@ -67,6 +68,10 @@ class Project(object):
         # Generate frontend app
         self._generate_frontend()
 
+        # Generate the docker-compose stack that runs both
+        if self._config.compose:
+            self._generate_compose()
+
         # Install dependencies
         self._install_dependencies()
 
@@ -81,6 +86,9 @@ class Project(object):
     def _generate_frontend(self):
         self._frontend_generator.generate()
 
+    def _generate_compose(self):
+        ComposeGenerator(self._config, self._root_folder).generate()
+
     def _install_dependencies(self):
         """
            Navigates to different directories and installs dependencies with pip and npm.
@@ -107,7 +115,9 @@ class Project(object):
             # Step 2: Install dependencies with pip
             print("\n2. Installing dependencies with pip...")
             if os.path.exists('requirements.txt'):
-                pip_result = subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'],
+                # The development requirements include the runtime ones and those of the tests
+                requirements = 'requirements-dev.txt' if os.path.exists('requirements-dev.txt') else 'requirements.txt'
+                pip_result = subprocess.run([sys.executable, '-m', 'pip', 'install', '-r', requirements],
                                             capture_output=True, text=True)
                 print(pip_result.stdout)
                 if pip_result.returncode != 0:
@@ -1,3 +1,4 @@
+import math
 from pygen.sanitizers import sanitize_filename
 
 
@@ -5,8 +6,14 @@ class DbConfiguration(object):
     """
     Manages the database configuration for production and development environments.
     Provides accessors and mutators for both production and development databases.
+
+    Each environment is either the name of a database engine or a dictionary with an
+    'engine' key and optional connection pool settings (see POOL_OPTIONS). The production
+    environment may also list the URLs of its read 'replicas'.
     """
 
+    POOL_OPTIONS = ["pool_size", "max_overflow", "pool_recycle", "pool_pre_ping", "statement_timeout"]
+
     def __init__(self, yaml_db=None):
         """
         Initializes DbConfiguration with YAML data, if provided.
@@ -16,11 +23,34 @@ class DbConfiguration(object):
                                       and optional 'development' database configurations.
         """
         if yaml_db is not None:
-            self._production = yaml_db['production']
-            self._development = yaml_db.get('development', None)
+            self._production, self._production_options = self._parse_environment(yaml_db['production'])
+            self._development, self._development_options = self._parse_environment(yaml_db.get('development', None))
+            self._approximate_count_threshold = yaml_db.get('approximate_count_threshold', None)
+            production = yaml_db['production']
+            self._production_replicas = production.get('replicas', []) if isinstance(production, dict) else []
         else:
             self._production = None
             self._development = None
+            self._production_options = {}
+            self._development_options = {}
+            self._approximate_count_threshold = None
+            self._production_replicas = []
+
+    @classmethod
+    def _parse_environment(cls, yaml_environment):
+        """
+        Splits the configuration of an environment into its engine and pool settings.
+
+        Args:
+            yaml_environment (str or dict or None): Engine name or dictionary with 'engine' and pool settings.
+
+        Returns:
+            tuple: The engine name and a dictionary with the pool settings.
+        """
+        if isinstance(yaml_environment, dict):
+            options = {key: yaml_environment[key] for key in cls.POOL_OPTIONS if key in yaml_environment}
+            return yaml_environment["engine"], options
+        return yaml_environment, {}
 
     @property
     def production(self):
@@ -42,6 +72,58 @@ class DbConfiguration(object):
         """
         return self._development
 
+    @property
+    def production_options(self):
+        """
+        Gets the connection pool settings of the production database.
+
+        Returns:
+            dict: Pool settings, empty when the engine defaults are used.
+        """
+        return self._production_options
+
+    @property
+    def development_options(self):
+        """
+        Gets the connection pool settings of the development database.
+
+        Returns:
+            dict: Pool settings, empty when the engine defaults are used.
+        """
+        return self._development_options
+
+    @property
+    def production_replicas(self):
+        """
+        Gets the URLs of the production read replicas.
+
+        Returns:
+            list: Replica database URLs, empty when every query goes to the primary.
+        """
+        return self._production_replicas
+
+    @property
+    def approximate_count_threshold(self):
+        """
+        Gets the row count above which PostgreSQL tables are counted with the planner estimate.
+
+        Returns:
+            int or None: Threshold in rows, or None if counts are always exact.
+        """
+        return self._approximate_count_threshold
+
+    def uses_engine(self, engine):
+        """
+        Checks whether any environment uses the given database engine.
+
+        Args:
+            engine (str): Database engine name, e.g. 'postgresql'.
+
+        Returns:
+            bool: True if the production or development database uses the engine.
+        """
+        return engine in [self._production, self._development]
+
     def set_production(self, database):
         """
         Sets the production database configuration.
@@ -79,9 +161,85 @@ class BackendConfiguration(object):
             self._architecture = yaml_backend["architecture"]
             self._framework = yaml_backend["framework"]
             self._database = DbConfiguration(yaml_backend["database"])
+            self._serialization = yaml_backend.get("serialization", "marshmallow")
+            self._validation = yaml_backend.get("validation", "marshmallow")
+            self._compression = self._parse_compression(yaml_backend.get("compression", None))
+            self._rate_limit = self._parse_rate_limit(yaml_backend.get("rate_limit", None))
+            self._metrics = yaml_backend.get("metrics", False)
         else:
             self._framework = None
             self._database = DbConfiguration()
+            self._serialization = "marshmallow"
+            self._validation = "marshmallow"
+            self._compression = None
+            self._rate_limit = None
+            self._metrics = False
+
+    @staticmethod
+    def _parse_compression(yaml_compression):
+        """
+        Fills the compression settings with their defaults.
+
+        Args:
+            yaml_compression (dict or None): YAML dictionary with 'min_size', 'level',
+                                             'mimetypes' and 'brotli', all optional.
+
+        Returns:
+            dict or None: The compression settings, or None if compression is disabled.
+        """
+        if yaml_compression is None or yaml_compression is False:
+            return None
+        if yaml_compression is True:
+            yaml_compression = {}
+        return {
+            "min_size": yaml_compression.get("min_size", 1024),
+            "level": yaml_compression.get("level", 6),
+            "mimetypes": yaml_compression.get("mimetypes", ["application/json"]),
+            "brotli": yaml_compression.get("brotli", False),
+        }
+
+    @staticmethod
+    def _parse_rate_limit(yaml_rate_limit):
+        """
+        Fills the rate limiting settings with their defaults.
+
+        Each set of limits has a token bucket 'rate' (requests per second) and 'burst',
+        and a 'max_concurrent' cap on in-flight requests; a missing limit is None. The
+        limits of an entity override the default ones, which fill in the rest.
+
+        Args:
+            yaml_rate_limit (dict or None): YAML dictionary with 'store', 'redis_url', 'key',
+                                            'default' limits and per-entity limits in 'entities'.
+
+        Returns:
+            dict or None: The rate limiting settings, or None if rate limiting is disabled.
+        """
+        if yaml_rate_limit is None:
+            return None
+
+        def limits(yaml_limits):
+            rate = yaml_limits.get("rate", None)
+            burst = yaml_limits.get("burst", None)
+            if rate is not None and burst is None:
+                burst = max(1, math.ceil(rate))
+            return {"rate": rate, "burst": burst, "max_concurrent": yaml_limits.get("max_concurrent", None)}
+
+        def entity_limits(yaml_limits):
+            merged = {**yaml_default, **yaml_limits}
+            if "rate" in yaml_limits and "burst" not in yaml_limits:
+                # The default burst is sized for the default rate, the entity one follows its own rate
+                merged.pop("burst", None)
+            return limits(merged)
+
+        yaml_default = yaml_rate_limit.get("default", {})
+        return {
+            "store": yaml_rate_limit.get("store", "memory"),
+            "redis_url": yaml_rate_limit.get("redis_url", "redis://localhost:6379/0"),
+            "key": yaml_rate_limit.get("key", "ip"),
+            "default": limits(yaml_default),
+            "entities": {name: entity_limits(yaml_limits)
+                         for name, yaml_limits in yaml_rate_limit.get("entities", {}).items()},
+        }
 
     @property
     def architecture(self):
@@ -113,6 +271,60 @@ class BackendConfiguration(object):
         """
         return self._database
 
+    @property
+    def serialization(self):
+        """
+        Gets the response serialization strategy.
+
+        Returns:
+            str: 'marshmallow' to dump responses with the schemas, or 'orjson' to use
+                 generated serializer functions and an orjson JSON provider.
+        """
+        return self._serialization
+
+    @property
+    def validation(self):
+        """
+        Gets the input validation backend.
+
+        Returns:
+            str: 'marshmallow' to validate with the schemas, or 'pydantic' to validate
+                 through compiled pydantic models with the same error messages.
+        """
+        return self._validation
+
+    @property
+    def compression(self):
+        """
+        Gets the response compression settings.
+
+        Returns:
+            dict or None: 'min_size' (bytes), 'level', 'mimetypes' and 'brotli',
+                          or None if compression is disabled.
+        """
+        return self._compression
+
+    @property
+    def rate_limit(self):
+        """
+        Gets the rate limiting and load shedding settings.
+
+        Returns:
+            dict or None: 'store', 'redis_url', 'key', 'default' and per-entity 'entities' limits,
+                          or None if rate limiting is disabled.
+        """
+        return self._rate_limit
+
+    @property
+    def metrics(self):
+        """
+        Gets whether the backend exposes Prometheus metrics.
+
+        Returns:
+            bool: True if a `/metrics` endpoint is generated.
+        """
+        return self._metrics
+
     def set_architecture(self, architecture):
         """
         Sets the backend framework if supported.
@@ -138,7 +350,7 @@ class BackendConfiguration(object):
         Raises:
             ValueError: If the framework is unsupported.
         """
-        if framework in ["flask"]:
+        if framework in ["flask", "fastapi"]:
             self._framework = framework
         else:
             raise ValueError(f"Unsupported backend framework: {framework}")
@@ -229,6 +441,8 @@ class ProjectConfiguration(object):
             self._backend = BackendConfiguration(yaml_configuration["backend"])
             self._frontend = FrontendConfiguration(yaml_configuration["frontend"])
             self._cicd = yaml_configuration.get("cicd", None)
+            self._test_layout = yaml_configuration.get("test_layout", "per_entity")
+            self._compose = self._parse_compose(yaml_configuration.get("compose", None))
 
         else:
             self._project_name = None
@@ -236,6 +450,32 @@ class ProjectConfiguration(object):
             self._backend = BackendConfiguration()
             self._frontend = FrontendConfiguration()
             self._cicd = None
+            self._test_layout = "per_entity"
+            self._compose = None
+
+    @staticmethod
+    def _parse_compose(yaml_compose):
+        """
+        Fills the docker-compose stack settings with their defaults.
+
+        Args:
+            yaml_compose (dict or None): YAML dictionary with 'replicas', 'workers', 'port',
+                                         'micro_cache' and 'postgres' settings, all optional.
+
+        Returns:
+            dict or None: The stack settings, or None if no stack is generated.
+        """
+        if yaml_compose is None or yaml_compose is False:
+            return None
+        if yaml_compose is True:
+            yaml_compose = {}
+        return {
+            "replicas": yaml_compose.get("replicas", 2),
+            "workers": yaml_compose.get("workers", 2),
+            "port": yaml_compose.get("port", 8080),
+            "micro_cache": yaml_compose.get("micro_cache", None),
+            "postgres": yaml_compose.get("postgres", {}),
+        }
 
     @property
     def project_name(self):
@@ -287,6 +527,29 @@ class ProjectConfiguration(object):
         """
         return self._cicd
 
+    @property
+    def test_layout(self):
+        """
+        Gets how the generated unit tests are laid out.
+
+        Returns:
+            str: 'per_entity' for test modules per entity and component, or 'consolidated' for a
+                 single parametrized module per layer driven by a table of the entities.
+        """
+        return self._test_layout
+
+    @property
+    def compose(self):
+        """
+        Gets the settings of the generated docker-compose stack.
+
+        Returns:
+            dict or None: 'replicas' of the backend, server 'workers' per replica, host 'port' of the
+                          load balancer, 'micro_cache' seconds of GET responses (None to disable) and
+                          'postgres' setting overrides, or None if no stack is generated.
+        """
+        return self._compose
+
     def set_cicd(self, cicd):
         """
         Sets the ci/cd platform after sanitizing it.
@@ -386,7 +649,7 @@ class ProjectConfiguration(object):
 
         # Select backend framework
         print("\nSelect backend framework:")
-        self._backend.set_framework(self._get_option(["flask"]))
+        self._backend.set_framework(self._get_option(["flask", "fastapi"]))
 
         # Select production database
         print("\nSelect production database:")
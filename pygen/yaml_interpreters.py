@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 import yaml
-from pygen.project_configuration import ProjectConfiguration
+from pygen.project_configuration import ProjectConfiguration, DbConfiguration
 from pygen.models.cim import CimModel
 from pygen.exceptions import ConfigurationException, ModelValidationException
 
@@ -61,6 +61,16 @@ class ConfigurationYAMLInterpreter(IYamlInterpreter):
     and transforms it into a ProjectConfiguration object.
     """
 
+    def __init__(self, model=None):
+        """
+        Initializes the interpreter.
+
+        Args:
+            model (CimModel, optional): Model the configuration is for. When given, the entity
+                                        names the configuration refers to are checked against it.
+        """
+        self._model = model
+
     def _validate(self, content):
         """
         Validates the YAML content for project configuration.
@@ -79,6 +89,8 @@ class ConfigurationYAMLInterpreter(IYamlInterpreter):
             self._validate_backend(content["backend"])
             self._validate_database(content["backend"]["database"])
             self._validate_frontend(content["frontend"])
+            if self._model is not None:
+                self._validate_entity_names(content["backend"], self._model)
             return True
         except ConfigurationException as ex:
             print(f"Validation Error: {ex}")
@@ -93,14 +105,55 @@ class ConfigurationYAMLInterpreter(IYamlInterpreter):
             content (dict): Parsed YAML content.
 
         Raises:
-            ConfigurationException: If 'project_name' is missing or auth is invalid.
+            ConfigurationException: If 'project_name' is missing or auth, cicd, test_layout or compose is invalid.
         """
         if 'project_name' not in content:
             raise ConfigurationException("The YAML file must contain 'project_name' at the root.")
         if 'auth' in content and content['auth'] not in ["jwt"]:
             raise ConfigurationException(f"Unsupported auth method {content['auth']}")
+        rate_limit = content.get('backend', {}).get('rate_limit')
+        if isinstance(rate_limit, dict) and rate_limit.get('key') == "jwt" and content.get('auth') != "jwt":
+            raise ConfigurationException("The 'jwt' rate limit key requires the jwt auth method.")
         if 'cicd' in content and content['cicd'] not in ["azure", "github"]:
             raise ConfigurationException(f"Unsupported cicd platform {content['cicd']}")
+        if content.get('test_layout', "per_entity") not in ["per_entity", "consolidated"]:
+            raise ConfigurationException(f"Unsupported test layout {content['test_layout']}")
+        if content.get('compose'):
+            ConfigurationYAMLInterpreter._validate_compose(content)
+
+    @staticmethod
+    def _validate_compose(content):
+        """
+        Validates the settings of the docker-compose stack.
+
+        Args:
+            content (dict): Parsed YAML content.
+
+        Raises:
+            ConfigurationException: If a stack setting is unknown or invalid, or the production
+                                    database is not PostgreSQL.
+        """
+        compose = content["compose"]
+        production = content.get('backend', {}).get('database', {}).get('production')
+        engine = production.get("engine") if isinstance(production, dict) else production
+        if engine != "postgresql":
+            # Every replica must share the database, which SQLite files cannot do across containers
+            raise ConfigurationException("The compose stack requires a postgresql production database.")
+        if compose is True:
+            return
+        if not isinstance(compose, dict):
+            raise ConfigurationException("The 'compose' option must be true or a mapping of settings.")
+        for key, value in compose.items():
+            if key not in ["replicas", "workers", "port", "micro_cache", "postgres"]:
+                raise ConfigurationException(f"Unsupported compose option: {key}")
+            if key in ["replicas", "workers", "port"]:
+                if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                    raise ConfigurationException(f"The compose '{key}' must be a positive integer.")
+            elif key == "micro_cache":
+                if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value < 1):
+                    raise ConfigurationException("The compose 'micro_cache' must be a positive integer of seconds.")
+            elif not isinstance(value, dict):
+                raise ConfigurationException("The compose 'postgres' settings must be a mapping.")
 
     @staticmethod
     def _validate_backend(backend):
@@ -111,7 +164,8 @@ class ConfigurationYAMLInterpreter(IYamlInterpreter):
             backend (dict): Backend section of the YAML content.
 
         Raises:
-            ConfigurationException: If backend framework is missing or unsupported.
+            ConfigurationException: If backend framework is missing or unsupported, or an
+                                    optional backend feature is invalid.
         """
         if 'architecture' not in backend:
             raise ConfigurationException("The backend must contain 'architecture'.")
@@ -119,14 +173,128 @@ class ConfigurationYAMLInterpreter(IYamlInterpreter):
             raise ConfigurationException("The backend must contain 'framework'.")
         if backend["architecture"] not in ["monolithic"]:
             raise ConfigurationException(f"Unsupported backend architecture: {backend['architecture']}")
-        if backend["framework"] not in ["flask"]:
+        if backend["framework"] not in ["flask", "fastapi"]:
             raise ConfigurationException(f"Unsupported backend framework: {backend['framework']}")
+        if backend.get("serialization", "marshmallow") not in ["marshmallow", "orjson"]:
+            raise ConfigurationException(f"Unsupported backend serialization: {backend['serialization']}")
+        if backend.get("serialization") == "orjson" and backend["framework"] != "flask":
+            raise ConfigurationException("The 'orjson' serialization is only supported by the flask framework.")
+        if backend.get("validation", "marshmallow") not in ["marshmallow", "pydantic"]:
+            raise ConfigurationException(f"Unsupported backend validation: {backend['validation']}")
+        if backend.get("validation") == "pydantic" and backend["framework"] != "flask":
+            raise ConfigurationException("The 'pydantic' validation is only supported by the flask framework.")
+        if backend.get("compression"):
+            ConfigurationYAMLInterpreter._validate_compression(backend)
+        if not isinstance(backend.get("metrics", False), bool):
+            raise ConfigurationException("The backend 'metrics' option must be a boolean.")
+        if backend.get("metrics") and backend["framework"] != "flask":
+            raise ConfigurationException("Prometheus metrics are only supported by the flask framework.")
+        if backend.get("rate_limit") is not None:
+            ConfigurationYAMLInterpreter._validate_rate_limit(backend)
+        production = backend.get("database", {}).get("production")
+        if isinstance(production, dict) and production.get("replicas") and backend["framework"] != "flask":
+            raise ConfigurationException("Read replicas are only supported by the flask framework.")
+
+    @staticmethod
+    def _validate_compression(backend):
+        """
+        Validates the response compression settings of the backend.
+
+        Args:
+            backend (dict): Backend section of the YAML content.
+
+        Raises:
+            ConfigurationException: If a compression setting is unknown or invalid.
+        """
+        if backend["framework"] != "flask":
+            raise ConfigurationException("Response compression is only supported by the flask framework.")
+        compression = backend["compression"]
+        if compression is True:
+            return
+        if not isinstance(compression, dict):
+            raise ConfigurationException("The backend 'compression' must be true or a mapping of settings.")
+        for key in compression:
+            if key not in ["min_size", "level", "mimetypes", "brotli"]:
+                raise ConfigurationException(f"Unsupported compression option: {key}")
+        min_size = compression.get("min_size", 0)
+        if isinstance(min_size, bool) or not isinstance(min_size, int) or min_size < 0:
+            raise ConfigurationException("The compression 'min_size' must be a non-negative integer.")
+        level = compression.get("level", 6)
+        if isinstance(level, bool) or not isinstance(level, int) or not 1 <= level <= 9:
+            raise ConfigurationException("The compression 'level' must be an integer between 1 and 9.")
+        if not isinstance(compression.get("mimetypes", []), list):
+            raise ConfigurationException("The compression 'mimetypes' must be a list.")
+        if not isinstance(compression.get("brotli", False), bool):
+            raise ConfigurationException("The compression 'brotli' option must be a boolean.")
+
+    @staticmethod
+    def _validate_rate_limit(backend):
+        """
+        Validates the rate limiting and load shedding settings of the backend.
+
+        Args:
+            backend (dict): Backend section of the YAML content.
+
+        Raises:
+            ConfigurationException: If a rate limiting setting is unknown or invalid.
+        """
+        if backend["framework"] != "flask":
+            raise ConfigurationException("Rate limiting is only supported by the flask framework.")
+        rate_limit = backend["rate_limit"]
+        if not isinstance(rate_limit, dict):
+            raise ConfigurationException("The backend 'rate_limit' must be a mapping of settings.")
+        for key in rate_limit:
+            if key not in ["store", "redis_url", "key", "default", "entities"]:
+                raise ConfigurationException(f"Unsupported rate_limit option: {key}")
+        if rate_limit.get("store", "memory") not in ["memory", "redis"]:
+            raise ConfigurationException(f"Unsupported rate_limit store: {rate_limit['store']}")
+        if rate_limit.get("key", "ip") not in ["ip", "jwt"]:
+            raise ConfigurationException(f"Unsupported rate_limit key: {rate_limit['key']}")
+        entities = rate_limit.get("entities", {})
+        if not isinstance(entities, dict):
+            raise ConfigurationException("The rate_limit 'entities' must map entity names to limits.")
+        default = rate_limit.get("default", {})
+        for name, limits in [("default", default)] + list(entities.items()):
+            if not isinstance(limits, dict):
+                raise ConfigurationException(f"The rate limits of '{name}' must be a mapping.")
+            for key, value in limits.items():
+                if key not in ["rate", "burst", "max_concurrent"]:
+                    raise ConfigurationException(f"Unsupported rate limit of '{name}': {key}")
+                if key == "rate":
+                    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                        raise ConfigurationException(f"The rate of '{name}' must be a positive number.")
+                elif isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                    raise ConfigurationException(f"The {key} of '{name}' must be a positive integer.")
+            # The limits of an entity take the default rate when they set none
+            if "burst" in limits and "rate" not in limits and (name == "default" or "rate" not in default):
+                raise ConfigurationException(f"The burst of '{name}' requires a rate.")
+
+    @staticmethod
+    def _validate_entity_names(backend, model):
+        """
+        Validates that the backend settings given per entity refer to entities of the model.
+
+        Args:
+            backend (dict): Backend section of the YAML content.
+            model (CimModel): Model the configuration is for.
+
+        Raises:
+            ConfigurationException: If a setting refers to an entity the model does not define.
+        """
+        entity_names = {entity.name.lower() for entity in model.entities}
+        rate_limit = backend.get("rate_limit")
+        for name in (rate_limit.get("entities", {}) if isinstance(rate_limit, dict) else {}):
+            if name.lower() not in entity_names:
+                raise ConfigurationException(f"The rate_limit 'entities' refer to an unknown entity: {name}")
 
     @staticmethod
     def _validate_database(database):
         """
         Validates the database configuration in the YAML content.
 
+        Each environment is either the engine name or a dictionary with an 'engine'
+        key and optional connection pool settings.
+
         Args:
             database (dict): Database section of the YAML content.
 
@@ -135,10 +303,56 @@ class ConfigurationYAMLInterpreter(IYamlInterpreter):
         """
         if 'production' not in database or 'development' not in database:
             raise ConfigurationException("The database configuration must include 'production' and 'development'.")
-        if database["production"] not in ["postgresql", "sqlite"]:
-            raise ConfigurationException(f"Unsupported production database: {database['production']}")
-        if database["development"] not in ["postgresql", "sqlite"]:
-            raise ConfigurationException(f"Unsupported development database: {database['development']}")
+        for environment in ["production", "development"]:
+            engine = database[environment]
+            if isinstance(engine, dict):
+                if 'engine' not in engine:
+                    raise ConfigurationException(f"The {environment} database must contain 'engine'.")
+                ConfigurationYAMLInterpreter._validate_pool_options(environment, engine)
+                engine = engine["engine"]
+            if engine not in ["postgresql", "sqlite"]:
+                raise ConfigurationException(f"Unsupported {environment} database: {engine}")
+        if 'approximate_count_threshold' in database:
+            threshold = database['approximate_count_threshold']
+            if isinstance(threshold, bool) or not isinstance(threshold, int) or threshold <= 0:
+                raise ConfigurationException("The database 'approximate_count_threshold' must be a positive integer.")
+            if not DbConfiguration(database).uses_engine("postgresql"):
+                raise ConfigurationException("The database 'approximate_count_threshold' "
+                                             "is only supported with postgresql.")
+
+    @staticmethod
+    def _validate_pool_options(environment, database):
+        """
+        Validates the connection pool settings of a database environment.
+
+        Args:
+            environment (str): Either 'production' or 'development'.
+            database (dict): Database environment section of the YAML content.
+
+        Raises:
+            ConfigurationException: If a setting is unknown or has an invalid value.
+        """
+        for key, value in database.items():
+            if key == "engine":
+                continue
+            if key == "replicas" and environment == "production":
+                if not isinstance(value, list) or not all(isinstance(url, str) and url for url in value):
+                    raise ConfigurationException("The production database 'replicas' must be a list of URLs.")
+                if database["engine"] != "postgresql":
+                    raise ConfigurationException("The production database 'replicas' "
+                                                 "are only supported with postgresql.")
+                continue
+            if key not in DbConfiguration.POOL_OPTIONS:
+                raise ConfigurationException(f"Unsupported {environment} database option: {key}")
+            if key == "pool_pre_ping":
+                if not isinstance(value, bool):
+                    raise ConfigurationException(f"The {environment} database option '{key}' must be a boolean.")
+            elif isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                raise ConfigurationException(f"The {environment} database option '{key}' "
+                                             f"must be a non-negative integer.")
+        if "statement_timeout" in database and database["engine"] != "postgresql":
+            raise ConfigurationException(f"The {environment} database option 'statement_timeout' "
+                                         f"is only supported with postgresql.")
 
     @staticmethod
     def _validate_frontend(frontend):
@@ -0,0 +1,58 @@
+import yaml
+
+from pygen.generators.compose_generator import ComposeGenerator
+from pygen.project_configuration import ProjectConfiguration
+
+
+def configuration(framework="flask", **backend):
+    """
+    Builds the configuration of a project deployed with the compose stack.
+    """
+    return ProjectConfiguration({
+        "project_name": "Example",
+        "compose": True,
+        "backend": {
+            "architecture": "monolithic",
+            "framework": framework,
+            "database": {"production": {"engine": "postgresql"}, "development": "sqlite"},
+            **backend,
+        },
+        "frontend": {"framework": "react"},
+    })
+
+
+def generate(config, tmp_path):
+    """
+    Generates the stack into `tmp_path` and returns its services.
+    """
+    ComposeGenerator(config, str(tmp_path)).generate()
+    with open(tmp_path / "docker-compose.yml") as file:
+        return yaml.safe_load(file)["services"]
+
+
+def test_production_replicas_read_from_the_stack_database(tmp_path):
+    config = configuration(database={
+        "production": {"engine": "postgresql", "replicas": ["postgresql://replica-1/app", "postgresql://replica-2/app"]},
+        "development": "sqlite",
+    })
+    services = generate(config, tmp_path)
+
+    for service in ["backend", "migrate"]:
+        environment = services[service]["environment"]
+        assert environment["DATABASE_REPLICA_URL_0"] == environment["DATABASE_URL"]
+        assert environment["DATABASE_REPLICA_URL_1"] == environment["DATABASE_URL"]
+
+
+def test_no_replica_urls_without_production_replicas(tmp_path):
+    services = generate(configuration(), tmp_path)
+
+    assert not any(name.startswith("DATABASE_REPLICA_URL") for name in services["backend"]["environment"])
+
+
+def test_fastapi_schema_is_created_once_before_the_replicas(tmp_path):
+    services = generate(configuration("fastapi"), tmp_path)
+
+    assert services["schema-init"]["command"] == ["python", "init_db.py"]
+    assert services["backend"]["depends_on"]["schema-init"] == {"condition": "service_completed_successfully"}
+    assert services["backend"]["environment"]["CREATE_SCHEMA"] == "false"
+    assert "CREATE_SCHEMA" not in services["schema-init"]["environment"]
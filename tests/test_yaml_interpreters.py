@@ -0,0 +1,62 @@
+import io
+
+import pytest
+import yaml
+
+from pygen.exceptions import ConfigurationException
+from pygen.models.cim import CimModel
+from pygen.yaml_interpreters import ConfigurationYAMLInterpreter
+
+MODEL = CimModel({
+    "entities": [
+        {"name": "Owner", "attributes": [{"name": "name", "type": "str"}]},
+        {"name": "Pet", "attributes": [{"name": "name", "type": "str"}]},
+    ],
+    "relationships": [],
+})
+
+
+def parse(rate_limit, model=MODEL):
+    """
+    Parses the configuration of a flask project with the given rate limiting settings.
+    """
+    content = {
+        "project_name": "Example",
+        "backend": {
+            "architecture": "monolithic",
+            "framework": "flask",
+            "database": {"production": "sqlite", "development": "sqlite"},
+            "rate_limit": rate_limit,
+        },
+        "frontend": {"framework": "react"},
+    }
+    return ConfigurationYAMLInterpreter(model).parse(io.StringIO(yaml.safe_dump(content)))
+
+
+def test_entity_rate_limits_are_merged_over_the_default():
+    config = parse({
+        "default": {"rate": 10, "burst": 50, "max_concurrent": 32},
+        "entities": {"Pet": {"rate": 2}, "Owner": {"max_concurrent": 4}},
+    })
+    entities = config.backend.rate_limit["entities"]
+
+    # The burst of an entity with its own rate follows that rate instead of the default one
+    assert entities["Pet"] == {"rate": 2, "burst": 2, "max_concurrent": 32}
+    assert entities["Owner"] == {"rate": 10, "burst": 50, "max_concurrent": 4}
+
+
+def test_entity_burst_takes_the_default_rate():
+    config = parse({"default": {"rate": 10}, "entities": {"Pet": {"burst": 20}}})
+
+    assert config.backend.rate_limit["entities"]["Pet"] == {"rate": 10, "burst": 20, "max_concurrent": None}
+
+
+def test_unknown_rate_limit_entity_is_rejected():
+    with pytest.raises(ConfigurationException, match="unknown entity: Cat"):
+        parse({"default": {"rate": 10}, "entities": {"Cat": {"rate": 2}}})
+
+
+def test_entity_names_are_not_checked_without_a_model():
+    config = parse({"entities": {"Cat": {"rate": 2}}}, model=None)
+
+    assert "Cat" in config.backend.rate_limit["entities"]